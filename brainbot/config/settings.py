@@ -58,6 +58,7 @@ class LCD5InchConfig(BaseModel):
     spi_device: int = 0
     width: int = 800
     height: int = 480
+    display_backend: str = "framebuffer"  # "framebuffer" or "kms" (needs pygame)
 
 
 class LEDConfig(BaseModel):
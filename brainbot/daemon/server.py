@@ -1729,6 +1729,7 @@ Write as a journal entry with today's date:
                 get_mood=get_mood,
                 get_activity=get_activity,
                 get_energy=get_energy,
+                backend=self.settings.hardware.lcd_5inch.display_backend,
             )
             self._face_animator.start()
             logger.info("Face animator started on 5-inch LCD")
@@ -0,0 +1,40 @@
+"""Shared TrueType font loading for the LCD drivers."""
+
+import functools
+import os
+from typing import Optional
+
+try:
+    from PIL import ImageFont
+    PIL_AVAILABLE = True
+except ImportError:
+    PIL_AVAILABLE = False
+
+FONT_REGULAR = "/usr/share/fonts/truetype/dejavu/DejaVuSans.ttf"
+FONT_BOLD = "/usr/share/fonts/truetype/dejavu/DejaVuSans-Bold.ttf"
+
+
+def font_path(bold: bool = False) -> Optional[str]:
+    """Path of the DejaVu font to use, or None if it isn't installed."""
+    if bold and os.path.exists(FONT_BOLD):
+        return FONT_BOLD
+    if os.path.exists(FONT_REGULAR):
+        return FONT_REGULAR
+    return None
+
+
+@functools.lru_cache(maxsize=64)
+def get_font(size: int, bold: bool = False) -> "ImageFont.ImageFont":
+    """
+    Load a font once per (size, weight) and share it between displays.
+
+    Fonts are only read from when drawing, so one instance can be used by
+    every driver and thread. Falls back to PIL's built-in bitmap font.
+    """
+    path = font_path(bold)
+    if path is not None:
+        try:
+            return ImageFont.truetype(path, size)
+        except Exception:
+            pass
+    return ImageFont.load_default()
@@ -20,6 +20,7 @@ States:
 
 import sys
 import time
+import random
 import threading
 import logging
 from typing import Tuple, Optional
@@ -68,6 +69,18 @@ class BrainBotMood(str, Enum):
     SUCCESS = "success"
 
 
+# Lookup for set_mood so unknown names don't go through Enum's ValueError path
+_MOOD_BY_STR = {m.value: m for m in BrainBotMood}
+
+# Moods that take effect immediately instead of waiting out the debounce
+# window. Sleeping is set on shutdown right before the process exits, when
+# the daemon debounce timer would never fire.
+IMMEDIATE_MOODS = frozenset({BrainBotMood.OFF, BrainBotMood.ERROR, BrainBotMood.SLEEPING})
+
+# Window (seconds) within which rapid set_mood calls collapse to the last one
+MOOD_DEBOUNCE_S = 0.03
+
+
 # Color definitions (R, G, B)
 COLORS = {
     'off': (0, 0, 0),
@@ -89,6 +102,17 @@ COLORS = {
     'dim_cyan': (0, 20, 20),
 }
 
+# Per-LED brightness for the speaking wave
+SPEAKING_WAVE = bytes((255, 180, 100, 50))
+
+# Flat RGB triples for the happy rotation: gold, orange, warm, peachy
+HAPPY_PALETTE = bytes((
+    255, 200, 0,
+    255, 150, 0,
+    255, 100, 50,
+    255, 180, 80,
+))
+
 
 class ExpansionLEDs:
     """
@@ -96,8 +120,25 @@ class ExpansionLEDs:
 
     Provides mood-based lighting that lets BrainBot express itself
     and communicate with humans through light patterns.
+
+    The board is shared between the caller's thread and the animation
+    thread. Public entry points that touch it take ``_ctl_lock``; the
+    animation threads themselves never hold it.
     """
 
+    __slots__ = (
+        'expansion',
+        '_animation_thread',
+        '_stop_animation',
+        '_current_mood',
+        '_brightness',
+        '_pending_mood',
+        '_mood_timer',
+        '_ctl_lock',
+        '_current_led_mode',
+        '_mode_lock',
+    )
+
     def __init__(self):
         """Initialize the LED controller."""
         self.expansion: Optional[Expansion] = None
@@ -105,17 +146,44 @@ class ExpansionLEDs:
         self._stop_animation = threading.Event()
         self._current_mood = BrainBotMood.OFF
         self._brightness = 1.0  # Global brightness multiplier (0.0-1.0)
+        self._pending_mood: Optional[BrainBotMood] = None
+        self._mood_timer: Optional[threading.Timer] = None
+        # Serializes mood/flash/pulse setup and cleanup so two callers can't
+        # interleave I2C writes or start competing animation threads.
+        # Reentrant because set_mood dispatches into success().
+        self._ctl_lock = threading.RLock()
+        # Last mode written to the board, so back-to-back mode-1 effects
+        # skip the redundant set_led_mode(1). Animation threads set the mode
+        # too and must not take _ctl_lock (it is held while joining them),
+        # so the cache has its own lock.
+        self._current_led_mode: Optional[int] = None
+        self._mode_lock = threading.Lock()
 
         if EXPANSION_AVAILABLE:
             try:
                 self.expansion = Expansion()
                 # Start in RGB mode for direct control
                 self.expansion.set_led_mode(1)
+                self._current_led_mode = 1
                 logger.info("Expansion board LED controller initialized")
             except Exception as e:
                 logger.error(f"Failed to initialize expansion board: {e}")
                 self.expansion = None
 
+    def _set_mode(self, mode: int, force: bool = False):
+        """
+        Set the board's LED mode, skipping the write if already in it.
+
+        Args:
+            mode: Board LED mode (1 = RGB, 3 = breathing, 4 = rainbow)
+            force: Write even if cached; the breathing mode is re-sent after
+                each colour change so the board latches the new colour
+        """
+        with self._mode_lock:
+            if force or self._current_led_mode != mode:
+                self.expansion.set_led_mode(mode)
+                self._current_led_mode = mode
+
     def _scale_color(self, r: int, g: int, b: int) -> Tuple[int, int, int]:
         """Apply brightness scaling to a color."""
         return (
@@ -128,7 +196,7 @@ class ExpansionLEDs:
         """Set all LEDs to a color."""
         if self.expansion:
             r, g, b = self._scale_color(r, g, b)
-            self.expansion.set_led_mode(1)
+            self._set_mode(1)
             self.expansion.set_all_led_color(r, g, b)
 
     def _set_led(self, led_id: int, r: int, g: int, b: int):
@@ -160,18 +228,59 @@ class ExpansionLEDs:
         """
         Set BrainBot's mood/state.
 
+        Calls arriving within MOOD_DEBOUNCE_S of each other are coalesced so
+        only the last mood is shown; off, error and sleeping apply immediately.
+
         Args:
             mood: One of: off, sleeping, idle, listening, thinking,
                   speaking, happy, excited, calm, attention, error, success
         """
-        try:
-            mood_enum = BrainBotMood(mood.lower())
-        except ValueError:
-            logger.warning(f"Unknown mood: {mood}")
-            return
+        with self._ctl_lock:
+            mood_enum = _MOOD_BY_STR.get(mood.lower())
+            if mood_enum is None:
+                logger.warning(f"Unknown mood: {mood}")
+                return
+
+            self._current_mood = mood_enum
 
-        self._current_mood = mood_enum
+            # A burst of transitions (listening -> thinking -> speaking) only
+            # needs to show the last one; off/error skip the wait.
+            self._cancel_pending_mood()
+
+            if mood_enum in IMMEDIATE_MOODS:
+                self._apply_mood(mood_enum)
+                return
+
+            self._pending_mood = mood_enum
+            self._mood_timer = threading.Timer(MOOD_DEBOUNCE_S, self._apply_pending_mood)
+            self._mood_timer.daemon = True
+            self._mood_timer.start()
+
+    def _cancel_pending_mood(self):
+        """
+        Drop a debounced mood that hasn't been shown yet.
 
+        Every mood/effect entry point calls this first, so a mood set just
+        before a direct call (e.g. set_mood("thinking") then success())
+        can't replace it when the debounce timer fires.
+        """
+        with self._ctl_lock:
+            if self._mood_timer:
+                self._mood_timer.cancel()
+                self._mood_timer = None
+            self._pending_mood = None
+
+    def _apply_pending_mood(self):
+        """Apply the most recent mood once the debounce window has passed."""
+        with self._ctl_lock:
+            mood_enum = self._pending_mood
+            self._pending_mood = None
+            self._mood_timer = None
+            if mood_enum is not None:
+                self._apply_mood(mood_enum)
+
+    def _apply_mood(self, mood_enum: BrainBotMood):
+        """Run the display function for a mood."""
         # Map moods to their display functions
         mood_handlers = {
             BrainBotMood.OFF: self.off,
@@ -200,190 +309,220 @@ class ExpansionLEDs:
 
     def off(self):
         """Turn off all LEDs."""
+        self._cancel_pending_mood()
         self._stop_current_animation()
         self._set_all(0, 0, 0)
         self._current_mood = BrainBotMood.OFF
 
     def sleeping(self):
         """Very dim, slow breathing - BrainBot is resting."""
+        self._cancel_pending_mood()
         self._current_mood = BrainBotMood.SLEEPING
 
         def _animate():
             if self.expansion:
                 self.expansion.set_all_led_color(15, 0, 30)  # Very dim purple
-                self.expansion.set_led_mode(3)  # Hardware breathing
+                self._set_mode(3, force=True)  # Hardware breathing
 
         self._stop_current_animation()
         _animate()
 
     def idle(self):
         """Calm breathing cyan - waiting for interaction."""
+        self._cancel_pending_mood()
         self._current_mood = BrainBotMood.IDLE
 
         def _animate():
             if self.expansion:
                 self.expansion.set_all_led_color(0, 80, 100)
-                self.expansion.set_led_mode(3)  # Hardware breathing
+                self._set_mode(3, force=True)  # Hardware breathing
 
         self._stop_current_animation()
         _animate()
 
     def listening(self):
         """Bright solid blue - paying attention to user."""
+        self._cancel_pending_mood()
         self._stop_current_animation()
         self._current_mood = BrainBotMood.LISTENING
         self._set_all(0, 100, 255)
 
     def thinking(self):
         """Rainbow cycling - processing/generating response."""
+        self._cancel_pending_mood()
         self._current_mood = BrainBotMood.THINKING
 
         def _animate():
             if self.expansion:
-                self.expansion.set_led_mode(4)  # Hardware rainbow
+                self._set_mode(4, force=True)  # Hardware rainbow
 
         self._stop_current_animation()
         _animate()
 
     def speaking(self):
         """Green wave animation - BrainBot is talking."""
+        self._cancel_pending_mood()
         self._current_mood = BrainBotMood.SPEAKING
 
         def _animate():
-            if not self.expansion:
+            exp = self.expansion
+            if not exp:
                 return
-            self.expansion.set_led_mode(1)
+            # Hoist attribute lookups out of the frame loop
+            stop = self._stop_animation
+            wait = stop.wait
+            set_color = exp.set_led_color
+            wave = SPEAKING_WAVE
+            self._set_mode(1)
             offset = 0
-            while not self._stop_animation.is_set():
+            while not stop.is_set():
                 # Wave pattern across the 4 LEDs
                 for i in range(4):
                     # Create wave effect
-                    wave = [255, 180, 100, 50]
-                    brightness = wave[(i + offset) % 4]
-                    self.expansion.set_led_color(i, 0, brightness, int(brightness * 0.3))
-                offset = (offset + 1) % 4
-                time.sleep(0.12)
+                    brightness = wave[(i + offset) & 3]
+                    set_color(i, 0, brightness, int(brightness * 0.3))
+                offset = (offset + 1) & 3
+                wait(0.12)
 
         self._start_animation(_animate)
 
     def happy(self):
         """Bright warm colors - cheerful and content."""
+        self._cancel_pending_mood()
         self._current_mood = BrainBotMood.HAPPY
 
         def _animate():
-            if not self.expansion:
+            exp = self.expansion
+            if not exp:
                 return
-            self.expansion.set_led_mode(1)
-            colors = [
-                (255, 200, 0),   # Gold
-                (255, 150, 0),   # Orange
-                (255, 100, 50),  # Warm
-                (255, 180, 80),  # Peachy
-            ]
-            while not self._stop_animation.is_set():
-                for i, (r, g, b) in enumerate(colors):
-                    self.expansion.set_led_color(i, r, g, b)
+            # Hoist attribute lookups out of the frame loop
+            stop = self._stop_animation
+            wait = stop.wait
+            set_color = exp.set_led_color
+            palette = HAPPY_PALETTE
+            self._set_mode(1)
+            offset = 0
+            while not stop.is_set():
+                for i in range(4):
+                    j = ((i + offset) & 3) * 3
+                    r, g, b = palette[j:j + 3]
+                    set_color(i, r, g, b)
                 # Rotate colors slowly
-                colors = colors[1:] + colors[:1]
-                time.sleep(0.5)
+                offset = (offset + 1) & 3
+                wait(0.5)
 
         self._start_animation(_animate)
 
     def excited(self):
         """Fast sparkle/rainbow - very energetic!"""
+        self._cancel_pending_mood()
         self._current_mood = BrainBotMood.EXCITED
 
         def _animate():
-            if not self.expansion:
+            exp = self.expansion
+            if not exp:
                 return
-            self.expansion.set_led_mode(1)
-            import random
+            # Hoist attribute lookups out of the frame loop
+            stop = self._stop_animation
+            wait = stop.wait
+            set_color = exp.set_led_color
+            choice = random.choice
+            self._set_mode(1)
             bright_colors = [
                 (255, 0, 0), (0, 255, 0), (0, 0, 255),
                 (255, 255, 0), (255, 0, 255), (0, 255, 255),
             ]
-            while not self._stop_animation.is_set():
+            while not stop.is_set():
                 for i in range(4):
-                    r, g, b = random.choice(bright_colors)
-                    self.expansion.set_led_color(i, r, g, b)
-                time.sleep(0.08)
+                    r, g, b = choice(bright_colors)
+                    set_color(i, r, g, b)
+                wait(0.08)
 
         self._start_animation(_animate)
 
     def calm(self):
         """Soft, slow color transitions - peaceful."""
+        self._cancel_pending_mood()
         self._current_mood = BrainBotMood.CALM
 
         def _animate():
             if self.expansion:
                 self.expansion.set_all_led_color(60, 40, 100)  # Soft lavender
-                self.expansion.set_led_mode(3)  # Breathing
+                self._set_mode(3, force=True)  # Breathing
 
         self._stop_current_animation()
         _animate()
 
     def attention(self):
         """Flashing to get user's attention - "Hey! Look at me!" """
+        self._cancel_pending_mood()
         self._current_mood = BrainBotMood.ATTENTION
 
         def _animate():
             if not self.expansion:
                 return
-            self.expansion.set_led_mode(1)
+            self._set_mode(1)
             flash_count = 0
             while not self._stop_animation.is_set() and flash_count < 10:
                 # Flash cyan
                 self.expansion.set_all_led_color(0, 255, 255)
                 time.sleep(0.15)
+                flash_count += 1
+                if flash_count == 10 and not self._stop_animation.is_set():
+                    # End with solid cyan so user knows we want attention
+                    self.expansion.set_all_led_color(0, 200, 200)
+                    break
                 self.expansion.set_all_led_color(0, 0, 0)
                 time.sleep(0.1)
-                flash_count += 1
-            # End with solid cyan so user knows we want attention
-            if not self._stop_animation.is_set():
-                self.expansion.set_all_led_color(0, 200, 200)
 
         self._start_animation(_animate)
 
     def error(self):
         """Red alert - something went wrong."""
+        self._cancel_pending_mood()
         self._stop_current_animation()
         self._current_mood = BrainBotMood.ERROR
         self._set_all(255, 0, 0)
 
     def success(self):
         """Green flash then fade - task completed!"""
-        self._stop_current_animation()
-        self._current_mood = BrainBotMood.SUCCESS
+        with self._ctl_lock:
+            self._cancel_pending_mood()
+            self._stop_current_animation()
+            self._current_mood = BrainBotMood.SUCCESS
 
-        if not self.expansion:
-            return
+            if not self.expansion:
+                return
 
-        self.expansion.set_led_mode(1)
-        # Flash green 3 times
-        for _ in range(3):
-            self.expansion.set_all_led_color(0, 255, 0)
-            time.sleep(0.15)
-            self.expansion.set_all_led_color(0, 80, 0)
-            time.sleep(0.1)
-        # End on dim green
-        self.expansion.set_all_led_color(0, 60, 0)
+            self._set_mode(1)
+            # Flash green 3 times, ending on dim green
+            for i in range(3):
+                self.expansion.set_all_led_color(0, 255, 0)
+                time.sleep(0.15)
+                if i == 2:
+                    self.expansion.set_all_led_color(0, 60, 0)
+                    break
+                self.expansion.set_all_led_color(0, 80, 0)
+                time.sleep(0.1)
 
     # ========== Quick Actions ==========
 
     def flash(self, color: str = "cyan", times: int = 2):
         """Quick flash to acknowledge user input."""
-        self._stop_current_animation()
-        if not self.expansion:
-            return
+        with self._ctl_lock:
+            self._cancel_pending_mood()
+            self._stop_current_animation()
+            if not self.expansion:
+                return
 
-        r, g, b = COLORS.get(color, COLORS['cyan'])
-        self.expansion.set_led_mode(1)
+            r, g, b = COLORS.get(color, COLORS['cyan'])
+            self._set_mode(1)
 
-        for _ in range(times):
-            self.expansion.set_all_led_color(r, g, b)
-            time.sleep(0.1)
-            self.expansion.set_all_led_color(0, 0, 0)
-            time.sleep(0.08)
+            for _ in range(times):
+                self.expansion.set_all_led_color(r, g, b)
+                time.sleep(0.1)
+                self.expansion.set_all_led_color(0, 0, 0)
+                time.sleep(0.08)
 
     def acknowledge(self):
         """Quick cyan flash to show BrainBot heard something."""
@@ -399,49 +538,53 @@ class ExpansionLEDs:
 
     def pulse(self, color: str = "blue", duration: float = 1.0):
         """Single smooth pulse."""
-        if not self.expansion:
-            return
-
-        r, g, b = COLORS.get(color, COLORS['blue'])
-        self.expansion.set_led_mode(1)
-
-        # Fade in
-        steps = 20
-        for i in range(steps):
-            factor = i / steps
-            self.expansion.set_all_led_color(
-                int(r * factor), int(g * factor), int(b * factor)
-            )
-            time.sleep(duration / (steps * 2))
-
-        # Fade out
-        for i in range(steps, 0, -1):
-            factor = i / steps
-            self.expansion.set_all_led_color(
-                int(r * factor), int(g * factor), int(b * factor)
-            )
-            time.sleep(duration / (steps * 2))
+        with self._ctl_lock:
+            self._cancel_pending_mood()
+            if not self.expansion:
+                return
+
+            r, g, b = COLORS.get(color, COLORS['blue'])
+            self._set_mode(1)
+
+            # Fade in
+            steps = 20
+            for i in range(steps):
+                factor = i / steps
+                self.expansion.set_all_led_color(
+                    int(r * factor), int(g * factor), int(b * factor)
+                )
+                time.sleep(duration / (steps * 2))
+
+            # Fade out
+            for i in range(steps, 0, -1):
+                factor = i / steps
+                self.expansion.set_all_led_color(
+                    int(r * factor), int(g * factor), int(b * factor)
+                )
+                time.sleep(duration / (steps * 2))
 
     # ========== Cleanup ==========
 
     def cleanup(self):
         """Clean up resources."""
-        self._stop_animation.set()
-        # Give animation thread time to notice and exit
-        if self._animation_thread and self._animation_thread.is_alive():
-            self._animation_thread.join(timeout=0.5)
+        with self._ctl_lock:
+            self._cancel_pending_mood()
+            self._stop_animation.set()
+            # Give animation thread time to notice and exit
+            if self._animation_thread and self._animation_thread.is_alive():
+                self._animation_thread.join(timeout=0.5)
 
-        if self.expansion:
-            try:
-                self.expansion.set_led_mode(1)
-                self.expansion.set_all_led_color(0, 0, 0)
-            except:
-                pass
-            try:
-                self.expansion.end()
-            except:
-                pass
-            self.expansion = None
+            if self.expansion:
+                try:
+                    self._set_mode(1, force=True)
+                    self.expansion.set_all_led_color(0, 0, 0)
+                except:
+                    pass
+                try:
+                    self.expansion.end()
+                except:
+                    pass
+                self.expansion = None
 
     def __del__(self):
         """Destructor."""
@@ -5,15 +5,21 @@ Renders cute, expressive eyes that reflect BrainBot's mood and state.
 Inspired by Vector/Cozmo style robot faces.
 """
 
+import copy
+import fcntl
 import logging
 import math
+import mmap
+import os
+import queue
 import random
+import struct
 import threading
 import time
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from enum import Enum
 from pathlib import Path
-from typing import Optional, Callable, Tuple
+from typing import Dict, Optional, Callable, Tuple
 
 try:
     from PIL import Image, ImageDraw
@@ -21,12 +27,61 @@ try:
 except ImportError:
     PIL_AVAILABLE = False
 
+try:
+    import numpy as np
+    NUMPY_AVAILABLE = True
+except ImportError:
+    NUMPY_AVAILABLE = False
+
+# Optional: pygame's KMS/DRM video driver for page-flipped display output.
+# Imported by _load_pygame() only when the "kms" backend is selected, so the
+# default framebuffer backend never loads SDL.
+pygame = None
+
+
+def _load_pygame() -> bool:
+    """Import pygame on first use; returns whether it is available."""
+    global pygame
+    if pygame is None:
+        try:
+            os.environ.setdefault("PYGAME_HIDE_SUPPORT_PROMPT", "1")
+            import pygame as _pygame
+        except ImportError:
+            return False
+        pygame = _pygame
+    return True
+
+# Optional: numba spreads the BGRA swap across cores (not a hard dependency)
+try:
+    from numba import njit, prange
+    NUMBA_AVAILABLE = NUMPY_AVAILABLE
+except ImportError:
+    NUMBA_AVAILABLE = False
+
+if NUMBA_AVAILABLE:
+    @njit(parallel=True, cache=True)
+    def _rgb_to_bgra(rgb, out):
+        """Swap R and B into a preallocated BGRA buffer (alpha left as-is)."""
+        height, width, _ = rgb.shape
+        for y in prange(height):
+            for x in range(width):
+                out[y, x, 0] = rgb[y, x, 2]
+                out[y, x, 1] = rgb[y, x, 1]
+                out[y, x, 2] = rgb[y, x, 0]
+
 logger = logging.getLogger(__name__)
 
 # Display dimensions (5-inch LCD)
 DISPLAY_WIDTH = 800
 DISPLAY_HEIGHT = 480
 
+# linux/fb.h: FBIOGET_VSCREENINFO fills a 160-byte fb_var_screeninfo whose
+# seventh u32 is bits_per_pixel
+FBIOGET_VSCREENINFO = 0x4600
+FB_VAR_SCREENINFO_SIZE = 160
+
+FULL_SCREEN_RECT = (0, 0, DISPLAY_WIDTH, DISPLAY_HEIGHT)
+
 # Face colors
 BACKGROUND_COLOR = (15, 15, 25)  # Dark blue-black
 EYE_COLOR = (100, 200, 255)  # Bright cyan/blue
@@ -35,6 +90,15 @@ PUPIL_COLOR = (20, 60, 100)  # Darker blue for pupil
 BLUSH_COLOR = (255, 150, 180, 80)  # Pink blush (with alpha)
 
 
+def _union_box(a: Optional[Tuple], b: Optional[Tuple]) -> Optional[Tuple]:
+    """Smallest box containing both boxes (either may be None)."""
+    if a is None:
+        return b
+    if b is None:
+        return a
+    return (min(a[0], b[0]), min(a[1], b[1]), max(a[2], b[2]), max(a[3], b[3]))
+
+
 class Expression(str, Enum):
     """Face expressions."""
     IDLE = "idle"
@@ -52,7 +116,11 @@ class Expression(str, Enum):
     BLINK = "blink"
 
 
-@dataclass
+# Expressions with so little motion they are rendered at half resolution
+LOW_DETAIL_EXPRESSIONS = frozenset({Expression.SLEEPY, Expression.SLEEPING})
+
+
+@dataclass(slots=True)
 class EyeState:
     """State of a single eye."""
     x: float  # Center X position
@@ -62,9 +130,13 @@ class EyeState:
     pupil_x: float  # Pupil offset from center (-1 to 1)
     pupil_y: float  # Pupil offset from center (-1 to 1)
     roundness: float  # Corner roundness (0-1)
+    # Derived from width/height; refreshed when the expression changes
+    pupil_size: float = field(default=0.0, compare=False)
+    pupil_highlight: float = field(default=0.0, compare=False)
+    show_pupil: bool = field(default=True, compare=False)
 
 
-@dataclass
+@dataclass(slots=True)
 class FaceState:
     """Complete face state."""
     left_eye: EyeState
@@ -87,6 +159,36 @@ class FaceRenderer:
         if not PIL_AVAILABLE:
             raise ImportError("PIL/Pillow required for face rendering")
 
+        # Screen area that differs from the previous render, as (x0, y0, x1, y1)
+        self.dirty_rect: Tuple[int, int, int, int] = FULL_SCREEN_RECT
+        self._drawn_box: Optional[Tuple] = None
+        self._prev_drawn_box: Optional[Tuple] = None
+        self._full_refresh = True
+
+        # Persistent canvases (full and half resolution) reused every frame
+        self._canvases: Dict[float, Tuple[Image.Image, ImageDraw.ImageDraw]] = {}
+        for scale in (1.0, 0.5):
+            canvas = Image.new(
+                'RGB',
+                (int(DISPLAY_WIDTH * scale), int(DISPLAY_HEIGHT * scale)),
+                BACKGROUND_COLOR,
+            )
+            self._canvases[scale] = (canvas, ImageDraw.Draw(canvas, 'RGBA'))
+
+        # Pre-rasterized eye backgrounds and blush masks, keyed by geometry
+        self._eye_sprites: Dict[Tuple, Tuple[Image.Image, Tuple[int, int]]] = {}
+        self._blush_sprites: Dict[Tuple, Tuple[Image.Image, Tuple[int, int]]] = {}
+
+        # Build sprites for every expression up front
+        self.state = self._create_default_state()
+        for expression in Expression:
+            self.set_expression(expression)
+            scale = 0.5 if expression in LOW_DETAIL_EXPRESSIONS else 1.0
+            for eye in (self.state.left_eye, self.state.right_eye):
+                self._eye_sprite(eye, scale)
+                if self.state.blush > 0:
+                    self._blush_sprite(eye, self.state.blush, scale)
+
         # Default face state
         self.state = self._create_default_state()
 
@@ -114,6 +216,9 @@ class FaceRenderer:
             roundness=0.4,
         )
 
+        self._update_eye_geometry(left_eye)
+        self._update_eye_geometry(right_eye)
+
         return FaceState(
             left_eye=left_eye,
             right_eye=right_eye,
@@ -216,6 +321,15 @@ class FaceRenderer:
             for eye in [self.state.left_eye, self.state.right_eye]:
                 eye.height = self.EYE_HEIGHT * 0.05
 
+        self._update_eye_geometry(self.state.left_eye)
+        self._update_eye_geometry(self.state.right_eye)
+
+    def _update_eye_geometry(self, eye: EyeState) -> None:
+        """Precompute pupil sizes so rendering doesn't redo them every frame."""
+        eye.show_pupil = eye.height > self.EYE_HEIGHT * 0.15
+        eye.pupil_size = min(eye.width, eye.height) * 0.35
+        eye.pupil_highlight = eye.pupil_size * 0.3
+
     def look_at(self, x: float, y: float) -> None:
         """Make eyes look at a position (-1 to 1 range)."""
         x = max(-1, min(1, x))
@@ -224,52 +338,133 @@ class FaceRenderer:
             eye.pupil_x = x * 0.5  # Limit pupil movement
             eye.pupil_y = y * 0.5
 
-    def render(self) -> Image.Image:
-        """Render the face to an image."""
-        # Create image
-        img = Image.new('RGB', (DISPLAY_WIDTH, DISPLAY_HEIGHT), BACKGROUND_COLOR)
-        draw = ImageDraw.Draw(img, 'RGBA')
+    def state_key(self) -> Tuple:
+        """
+        Quantized snapshot of everything render() draws.
+
+        Two states with the same key produce visually identical frames
+        (0.01 of pupil travel is well under a pixel).
+        """
+        st = self.state
+        key = [st.expression, round(st.blush, 2), round(st.mouth_open, 2)]
+        for eye in (st.left_eye, st.right_eye):
+            key.extend((
+                eye.x, eye.y, eye.width, eye.height, eye.roundness,
+                round(eye.pupil_x, 2), round(eye.pupil_y, 2),
+            ))
+        return tuple(key)
+
+    def snapshot(self) -> FaceState:
+        """Copy the current face state so it can be rendered without a lock."""
+        st = self.state
+        return FaceState(
+            left_eye=copy.copy(st.left_eye),
+            right_eye=copy.copy(st.right_eye),
+            expression=st.expression,
+            blush=st.blush,
+            mouth_open=st.mouth_open,
+        )
+
+    def render(self, state: Optional[FaceState] = None) -> Image.Image:
+        """
+        Render the face to an image.
+
+        Args:
+            state: State to draw (e.g. from snapshot()); defaults to self.state
+
+        The returned image is a shared canvas that the next call redraws,
+        so consume (or copy) it before rendering again.
+        """
+        if state is None:
+            state = self.state
+
+        # Sleepy/sleeping faces barely move; draw them at half size
+        low_res = state.expression in LOW_DETAIL_EXPRESSIONS
+        scale = 0.5 if low_res else 1.0
+
+        # Reuse the persistent canvas for this scale, cleared to background
+        img, draw = self._canvases[scale]
+        img.paste(BACKGROUND_COLOR, (0, 0) + img.size)
+        self._drawn_box = None
 
         # Draw blush if present
-        if self.state.blush > 0:
-            self._draw_blush(draw, self.state.left_eye, self.state.blush)
-            self._draw_blush(draw, self.state.right_eye, self.state.blush)
+        if state.blush > 0:
+            self._draw_blush(img, state.left_eye, state.blush, scale)
+            self._draw_blush(img, state.right_eye, state.blush, scale)
 
         # Draw eyes
-        self._draw_eye(draw, self.state.left_eye)
-        self._draw_eye(draw, self.state.right_eye)
+        self._draw_eye(img, draw, state.left_eye, scale)
+        self._draw_eye(img, draw, state.right_eye, scale)
 
         # Draw mouth if speaking
-        if self.state.mouth_open > 0:
-            self._draw_mouth(draw, self.state.mouth_open)
+        if state.mouth_open > 0:
+            self._draw_mouth(draw, state.mouth_open, scale)
+
+        # Changed area = what was drawn last frame plus what is drawn now
+        drawn = self._to_screen_box(self._drawn_box, scale)
+        if self._full_refresh:
+            self.dirty_rect = FULL_SCREEN_RECT
+            self._full_refresh = False
+        else:
+            self.dirty_rect = _union_box(self._prev_drawn_box, drawn) or (0, 0, 0, 0)
+        self._prev_drawn_box = drawn
 
+        if low_res:
+            img = img.resize((DISPLAY_WIDTH, DISPLAY_HEIGHT), Image.NEAREST)
         return img
 
-    def _draw_eye(self, draw: ImageDraw.Draw, eye: EyeState) -> None:
-        """Draw a single eye."""
-        # Calculate eye bounds
-        half_w = eye.width / 2
-        half_h = eye.height / 2
-
-        left = eye.x - half_w
-        top = eye.y - half_h
-        right = eye.x + half_w
-        bottom = eye.y + half_h
-
-        # Calculate corner radius
-        radius = int(min(eye.width, eye.height) * eye.roundness)
+    def invalidate(self) -> None:
+        """Force the next render to report the whole screen as dirty."""
+        self._full_refresh = True
+
+    def _mark_drawn(self, x0: float, y0: float, x1: float, y1: float) -> None:
+        """Grow this frame's drawn-area box (canvas coordinates)."""
+        self._drawn_box = _union_box(self._drawn_box, (x0, y0, x1, y1))
+
+    @staticmethod
+    def _to_screen_box(box: Optional[Tuple], scale: float) -> Optional[Tuple[int, int, int, int]]:
+        """Convert a canvas-space box to a padded, clamped screen rectangle."""
+        if box is None:
+            return None
+        x0, y0, x1, y1 = box
+        return (
+            max(0, math.floor(x0 / scale) - 2),
+            max(0, math.floor(y0 / scale) - 2),
+            min(DISPLAY_WIDTH, math.ceil(x1 / scale) + 2),
+            min(DISPLAY_HEIGHT, math.ceil(y1 / scale) + 2),
+        )
 
-        # Draw eye background (white/light part)
+    def _eye_sprite(self, eye: EyeState, scale: float = 1.0) -> Tuple[Image.Image, Tuple[int, int]]:
+        """Get (building on first use) the eye background sprite and its origin."""
+        key = (eye.x, eye.y, eye.width, eye.height, eye.roundness, scale)
+        cached = self._eye_sprites.get(key)
+        if cached is not None:
+            return cached
+
+        x = eye.x * scale
+        y = eye.y * scale
+        width = eye.width * scale
+        height = eye.height * scale
+        half_w = width / 2
+        half_h = height / 2
+
+        # Draw at screen coordinates so the pixels match drawing in place,
+        # then crop down to the eye
+        layer = Image.new('RGBA', (DISPLAY_WIDTH, DISPLAY_HEIGHT), (0, 0, 0, 0))
+        draw = ImageDraw.Draw(layer)
+
+        # Eye background (white/light part)
+        radius = int(min(width, height) * eye.roundness)
         draw.rounded_rectangle(
-            [left, top, right, bottom],
+            [x - half_w, y - half_h, x + half_w, y + half_h],
             radius=radius,
             fill=EYE_COLOR,
         )
 
-        # Draw highlight (top-left shine)
-        highlight_size = min(eye.width, eye.height) * 0.25
-        highlight_x = eye.x - half_w * 0.4
-        highlight_y = eye.y - half_h * 0.4
+        # Highlight (top-left shine)
+        highlight_size = min(width, height) * 0.25
+        highlight_x = x - half_w * 0.4
+        highlight_y = y - half_h * 0.4
         draw.ellipse(
             [
                 highlight_x - highlight_size/2,
@@ -280,11 +475,68 @@ class FaceRenderer:
             fill=EYE_HIGHLIGHT,
         )
 
+        cached = self._crop_sprite(layer)
+        self._eye_sprites[key] = cached
+        return cached
+
+    def _blush_sprite(
+        self, eye: EyeState, intensity: float, scale: float = 1.0
+    ) -> Tuple[Image.Image, Tuple[int, int]]:
+        """Get (building on first use) the blush alpha mask and its origin."""
+        key = (eye.x, eye.y, eye.width, eye.height, intensity, scale)
+        cached = self._blush_sprites.get(key)
+        if cached is not None:
+            return cached
+
+        blush_x = eye.x * scale
+        blush_y = (eye.y + eye.height * 0.6) * scale
+        blush_w = eye.width * 0.8 * scale
+        blush_h = eye.height * 0.3 * scale
+
+        mask = Image.new('L', (DISPLAY_WIDTH, DISPLAY_HEIGHT), 0)
+        ImageDraw.Draw(mask).ellipse(
+            [
+                blush_x - blush_w/2,
+                blush_y - blush_h/2,
+                blush_x + blush_w/2,
+                blush_y + blush_h/2,
+            ],
+            fill=int(80 * intensity),
+        )
+
+        cached = self._crop_sprite(mask)
+        self._blush_sprites[key] = cached
+        return cached
+
+    @staticmethod
+    def _crop_sprite(layer: Image.Image) -> Tuple[Image.Image, Tuple[int, int]]:
+        """Crop a full-screen layer to its drawn area."""
+        bbox = layer.getbbox() or (0, 0, 1, 1)
+        return layer.crop(bbox), (bbox[0], bbox[1])
+
+    def _draw_eye(
+        self, img: Image.Image, draw: ImageDraw.Draw, eye: EyeState, scale: float = 1.0
+    ) -> None:
+        """Draw a single eye."""
+        # Paste the pre-rasterized background and top-left shine
+        sprite, origin = self._eye_sprite(eye, scale)
+        img.paste(sprite, origin, sprite)
+        self._mark_drawn(origin[0], origin[1], origin[0] + sprite.width, origin[1] + sprite.height)
+
         # Draw pupil (only if eye is open enough)
-        if eye.height > self.EYE_HEIGHT * 0.15:
-            pupil_size = min(eye.width, eye.height) * 0.35
-            pupil_x = eye.x + eye.pupil_x * (half_w - pupil_size/2)
-            pupil_y = eye.y + eye.pupil_y * (half_h - pupil_size/2)
+        if eye.show_pupil:
+            x = eye.x * scale
+            y = eye.y * scale
+            half_w = eye.width * scale / 2
+            half_h = eye.height * scale / 2
+
+            pupil_size = eye.pupil_size * scale
+            pupil_x = x + eye.pupil_x * (half_w - pupil_size/2)
+            pupil_y = y + eye.pupil_y * (half_h - pupil_size/2)
+            self._mark_drawn(
+                pupil_x - pupil_size/2, pupil_y - pupil_size/2,
+                pupil_x + pupil_size/2, pupil_y + pupil_size/2,
+            )
 
             draw.ellipse(
                 [
@@ -297,7 +549,7 @@ class FaceRenderer:
             )
 
             # Small highlight in pupil
-            small_highlight = pupil_size * 0.3
+            small_highlight = eye.pupil_highlight * scale
             draw.ellipse(
                 [
                     pupil_x - pupil_size/4 - small_highlight/2,
@@ -308,30 +560,25 @@ class FaceRenderer:
                 fill=EYE_HIGHLIGHT,
             )
 
-    def _draw_blush(self, draw: ImageDraw.Draw, eye: EyeState, intensity: float) -> None:
+    def _draw_blush(
+        self, img: Image.Image, eye: EyeState, intensity: float, scale: float = 1.0
+    ) -> None:
         """Draw blush under an eye."""
-        blush_color = (255, 150, 180, int(80 * intensity))
-        blush_x = eye.x
-        blush_y = eye.y + eye.height * 0.6
-        blush_w = eye.width * 0.8
-        blush_h = eye.height * 0.3
-
-        draw.ellipse(
-            [
-                blush_x - blush_w/2,
-                blush_y - blush_h/2,
-                blush_x + blush_w/2,
-                blush_y + blush_h/2,
-            ],
-            fill=blush_color,
-        )
+        mask, origin = self._blush_sprite(eye, intensity, scale)
+        box = origin + (origin[0] + mask.width, origin[1] + mask.height)
+        img.paste(BLUSH_COLOR[:3], box, mask)
+        self._mark_drawn(*box)
 
-    def _draw_mouth(self, draw: ImageDraw.Draw, openness: float) -> None:
+    def _draw_mouth(self, draw: ImageDraw.Draw, openness: float, scale: float = 1.0) -> None:
         """Draw a simple mouth."""
-        center_x = DISPLAY_WIDTH // 2
-        mouth_y = self.EYE_Y + self.EYE_HEIGHT * 0.9
-        mouth_w = 60
-        mouth_h = 20 + openness * 30
+        center_x = DISPLAY_WIDTH // 2 * scale
+        mouth_y = (self.EYE_Y + self.EYE_HEIGHT * 0.9) * scale
+        mouth_w = 60 * scale
+        mouth_h = (20 + openness * 30) * scale
+        self._mark_drawn(
+            center_x - mouth_w/2, mouth_y - mouth_h/2,
+            center_x + mouth_w/2, mouth_y + mouth_h/2,
+        )
 
         draw.ellipse(
             [
@@ -344,6 +591,86 @@ class FaceRenderer:
         )
 
 
+# Activity keywords checked in priority order
+ACTIVITY_EXPRESSIONS = (
+    ("thinking", Expression.THINKING),
+    ("planning", Expression.THINKING),
+    ("speaking", Expression.HAPPY),
+    ("chat", Expression.HAPPY),
+    ("sleep", Expression.SLEEPING),
+    ("story", Expression.EXCITED),
+    ("creative", Expression.EXCITED),
+)
+
+MOOD_EXPRESSIONS = {
+    "happy": Expression.HAPPY,
+    "content": Expression.IDLE,
+    "curious": Expression.CURIOUS,
+    "excited": Expression.EXCITED,
+    "tired": Expression.SLEEPY,
+    "sad": Expression.SAD,
+}
+
+
+def _expression_for(
+    activity: Optional[str], energy: Optional[float], mood: Optional[str]
+) -> Expression:
+    """Pick the face expression for the current activity, energy and mood."""
+    expression = Expression.IDLE
+
+    # Check activity first
+    if activity:
+        activity_lower = activity.lower()
+        for keyword, activity_expression in ACTIVITY_EXPRESSIONS:
+            if keyword in activity_lower:
+                expression = activity_expression
+                break
+
+    # Check energy level
+    if energy is not None:
+        if energy < 0.2:
+            expression = Expression.SLEEPY
+        elif energy < 0.1:
+            expression = Expression.SLEEPING
+
+    # Check mood
+    if mood is not None and expression == Expression.IDLE:
+        expression = MOOD_EXPRESSIONS.get(mood, Expression.IDLE)
+
+    return expression
+
+
+# How long the eyes stay shut during a blink (seconds)
+BLINK_DURATION = 0.1
+
+# Per-frame gaze easing factor and mouth oscillation step
+LOOK_LERP_SPEED = 0.1
+SPEAK_PHASE_STEP = 0.3
+
+
+def _step_motion(
+    look_x: float,
+    look_y: float,
+    target_x: float,
+    target_y: float,
+    speak_phase: float,
+    speaking: bool,
+    _sin: Callable[[float], float] = math.sin,
+) -> Tuple[float, float, float, float]:
+    """
+    Advance one frame of gaze easing and mouth oscillation.
+
+    Pure float math on locals so the per-frame cost is a handful of
+    arithmetic ops. Returns (look_x, look_y, speak_phase, mouth_open).
+    """
+    look_x += (target_x - look_x) * LOOK_LERP_SPEED
+    look_y += (target_y - look_y) * LOOK_LERP_SPEED
+    if not speaking:
+        return look_x, look_y, speak_phase, 0
+    speak_phase += SPEAK_PHASE_STEP
+    return look_x, look_y, speak_phase, (_sin(speak_phase) + 1) / 2 * 0.8
+
+
 class FaceAnimator:
     """
     Animates BrainBot's face with idle movements, blinking, and expressions.
@@ -354,6 +681,7 @@ class FaceAnimator:
         get_mood: Optional[Callable[[], str]] = None,
         get_activity: Optional[Callable[[], Optional[str]]] = None,
         get_energy: Optional[Callable[[], float]] = None,
+        backend: str = "framebuffer",
     ):
         """
         Initialize the face animator.
@@ -362,20 +690,33 @@ class FaceAnimator:
             get_mood: Callback to get current mood
             get_activity: Callback to get current activity
             get_energy: Callback to get energy level (0-1)
+            backend: "framebuffer" (mmap /dev/fb0) or "kms" (pygame KMS/DRM,
+                falls back to the framebuffer if unavailable)
         """
         self.renderer = FaceRenderer()
+        self._backend = backend
         self.get_mood = get_mood
         self.get_activity = get_activity
         self.get_energy = get_energy
 
-        self._running = False
+        self._stop_event = threading.Event()
         self._thread: Optional[threading.Thread] = None
         self._lock = threading.Lock()
 
+        # Rendering and framebuffer writes run on separate threads
+        self._display_thread: Optional[threading.Thread] = None
+        self._frame_queue: "queue.Queue[bytes]" = queue.Queue(maxsize=2)
+
         # Animation state
-        self._last_blink = time.time()
+        self._last_blink = time.monotonic()
         self._blink_interval = 3.0  # Seconds between blinks
-        self._last_look = time.time()
+        self._blink_start: Optional[float] = None  # Set while eyes are closed
+        self._blink_saved_expr = Expression.IDLE  # Restored when the blink ends
+
+        # Last (activity, energy, mood) seen and the expression derived from it
+        self._expr_inputs: Optional[Tuple] = None
+        self._expr_target = Expression.IDLE
+        self._last_look = time.monotonic()
         self._look_interval = 2.0  # Seconds between look changes
         self._current_look = (0.0, 0.0)
         self._target_look = (0.0, 0.0)
@@ -386,24 +727,83 @@ class FaceAnimator:
 
         # Framebuffer path
         self._fb_path = Path("/dev/fb0")
+        self._fb_fd: Optional[int] = None
+        self._fb_mmap: Optional[mmap.mmap] = None  # Mapped once in start()
         self._fb_warned = False  # Only warn once about framebuffer issues
+        self._fb_bytes_pp = 4  # Bytes per pixel, read from the device in start()
+
+        # KMS display surface, owned by the display thread when in use. The
+        # thread installs it under _kms_lock, and only if start() hasn't
+        # given up waiting and fallen back to the framebuffer
+        self._kms_screen = None
+        self._kms_lock = threading.Lock()
+
+        # State of the last rendered frame; unchanged state is not redrawn
+        self._last_state_key: Optional[Tuple] = None
+
+        # Reusable BGRA output buffer (alpha channel is constant)
+        self._bgra_buf = None
+        if NUMPY_AVAILABLE:
+            self._bgra_buf = np.empty((DISPLAY_HEIGHT, DISPLAY_WIDTH, 4), dtype=np.uint8)
+            self._bgra_buf[..., 3] = 255
 
     def start(self) -> None:
         """Start the face animation loop."""
-        if self._running:
+        if self._thread is not None:
             return
 
-        self._running = True
+        self._stop_event.clear()
+
+        if self._backend == "kms":
+            if _load_pygame():
+                # SDL must be driven from one thread, so the display thread
+                # sets up the KMS surface itself
+                ready = threading.Event()
+                cancelled = threading.Event()
+                self._display_thread = threading.Thread(
+                    target=self._kms_display_loop, args=(ready, cancelled), daemon=True,
+                )
+                self._display_thread.start()
+                if not ready.wait(timeout=5):
+                    # Still initialising: make sure it can't take over the
+                    # frame queue once the framebuffer loop is reading it
+                    with self._kms_lock:
+                        cancelled.set()
+                    self._display_thread.join(timeout=1)
+            if self._kms_screen is None:
+                logger.warning("KMS display unavailable, falling back to framebuffer")
+                self._display_thread = None
+
+        if self._kms_screen is None:
+            self._open_framebuffer()
+            if NUMBA_AVAILABLE and self._fb_mmap is not None:
+                # JIT-compile before the first real frame. Full frames write a
+                # contiguous view of _bgra_buf and dirty rects a strided one;
+                # numba compiles each layout separately, so convert one of each
+                # through the real path
+                self._to_bgra(Image.new("RGB", (DISPLAY_WIDTH, DISPLAY_HEIGHT)))
+                self._to_bgra(Image.new("RGB", (2, 2)))
+            if self._fb_mmap is not None:
+                self._display_thread = threading.Thread(target=self._display_loop, daemon=True)
+                self._display_thread.start()
+
+        # The display may hold anything; the first frame must be full
+        self._last_state_key = None
+        self.renderer.invalidate()
         self._thread = threading.Thread(target=self._animation_loop, daemon=True)
         self._thread.start()
         logger.info("Face animator started")
 
     def stop(self) -> None:
         """Stop the face animation loop."""
-        self._running = False
+        self._stop_event.set()
         if self._thread:
             self._thread.join(timeout=2)
             self._thread = None
+        if self._display_thread:
+            self._display_thread.join(timeout=2)
+            self._display_thread = None
+        self._close_framebuffer()
         logger.info("Face animator stopped")
 
     def set_speaking(self, speaking: bool) -> None:
@@ -420,9 +820,9 @@ class FaceAnimator:
         """Main animation loop."""
         frame_interval = 1/30  # 30 FPS
 
-        while self._running:
+        while not self._stop_event.is_set():
             try:
-                loop_start = time.time()
+                loop_start = time.monotonic()
 
                 # Update expression based on mood/activity
                 self._update_expression()
@@ -430,64 +830,124 @@ class FaceAnimator:
                 # Handle blinking
                 self._update_blink()
 
-                # Handle looking around
+                # Handle looking around and speaking animation
                 self._update_look()
+                self._update_motion()
 
-                # Handle speaking animation
-                self._update_speaking()
-
-                # Render and display
+                # Render only when something visible changed; the lock covers
+                # just the state snapshot, not the drawing
+                state = None
                 with self._lock:
-                    img = self.renderer.render()
-                self._display_to_framebuffer(img)
+                    key = self.renderer.state_key()
+                    if key != self._last_state_key:
+                        state = self.renderer.snapshot()
+                if state is not None:
+                    img = self.renderer.render(state)
+                    self._last_state_key = key
+                    self._queue_frame(img, self.renderer.dirty_rect)
 
                 # Maintain frame rate
-                elapsed = time.time() - loop_start
+                elapsed = time.monotonic() - loop_start
                 sleep_time = max(0, frame_interval - elapsed)
                 if sleep_time > 0:
-                    time.sleep(sleep_time)
+                    # Wakes immediately if stop() is called
+                    self._stop_event.wait(sleep_time)
 
             except Exception as e:
                 logger.error(f"Face animation error: {e}")
-                time.sleep(0.1)
+                self._stop_event.wait(0.1)
+
+    def _queue_frame(self, img: Image.Image, rect: Tuple[int, int, int, int]) -> None:
+        """
+        Hand a frame's changed region to the display thread.
+
+        If the display thread lags, pending updates are dropped and replaced
+        with a full-screen frame so no dropped region is left stale.
+        """
+        frame = self._frame_bytes(img, rect)
+        if frame is None:
+            return
+        try:
+            self._frame_queue.put_nowait(frame)
+        except queue.Full:
+            while True:
+                try:
+                    self._frame_queue.get_nowait()
+                except queue.Empty:
+                    break
+            # The display output may have gone away since the check above
+            full = self._frame_bytes(img, FULL_SCREEN_RECT)
+            if full is not None:
+                self._frame_queue.put_nowait(full)
+
+    def _display_loop(self) -> None:
+        """Copy queued frames into the framebuffer."""
+        while not self._stop_event.is_set():
+            try:
+                frame = self._frame_queue.get(timeout=0.1)
+            except queue.Empty:
+                continue
+            self._write_framebuffer(frame)
+
+    def _kms_display_loop(self, ready: threading.Event, cancelled: threading.Event) -> None:
+        """
+        Set up a KMS/DRM surface and page-flip queued frame regions onto it.
+
+        If start() stopped waiting (cancelled) before the surface was up,
+        the surface is torn down again instead of being installed.
+        """
+        try:
+            os.environ.setdefault("SDL_VIDEODRIVER", "kmsdrm")
+            pygame.display.init()
+            screen = pygame.display.set_mode((DISPLAY_WIDTH, DISPLAY_HEIGHT), pygame.FULLSCREEN)
+            pygame.mouse.set_visible(False)
+        except pygame.error as e:
+            logger.debug(f"KMS display init failed: {e}")
+            pygame.display.quit()
+            ready.set()
+            return
+
+        with self._kms_lock:
+            if cancelled.is_set():
+                logger.debug("KMS display came up after start() fell back, closing it")
+                pygame.display.quit()
+                return
+            self._kms_screen = screen
+        ready.set()
+
+        try:
+            while not self._stop_event.is_set():
+                pygame.event.pump()
+                try:
+                    (x0, y0, x1, y1), data = self._frame_queue.get(timeout=0.1)
+                except queue.Empty:
+                    continue
+                size = (x1 - x0, y1 - y0)
+                screen.blit(pygame.image.frombuffer(data, size, 'RGB'), (x0, y0))
+                pygame.display.update(pygame.Rect((x0, y0), size))
+        except Exception as e:
+            logger.error(f"KMS display error: {e}")
+        finally:
+            self._kms_screen = None
+            pygame.display.quit()
 
     def _update_expression(self) -> None:
         """Update expression based on current state."""
-        expression = Expression.IDLE
-
-        # Check activity first
-        if self.get_activity:
-            activity = self.get_activity()
-            if activity:
-                if "thinking" in activity.lower() or "planning" in activity.lower():
-                    expression = Expression.THINKING
-                elif "speaking" in activity.lower() or "chat" in activity.lower():
-                    expression = Expression.HAPPY
-                elif "sleep" in activity.lower():
-                    expression = Expression.SLEEPING
-                elif "story" in activity.lower() or "creative" in activity.lower():
-                    expression = Expression.EXCITED
-
-        # Check energy level
-        if self.get_energy:
-            energy = self.get_energy()
-            if energy < 0.2:
-                expression = Expression.SLEEPY
-            elif energy < 0.1:
-                expression = Expression.SLEEPING
-
-        # Check mood
-        if self.get_mood and expression == Expression.IDLE:
-            mood = self.get_mood()
-            mood_map = {
-                "happy": Expression.HAPPY,
-                "content": Expression.IDLE,
-                "curious": Expression.CURIOUS,
-                "excited": Expression.EXCITED,
-                "tired": Expression.SLEEPY,
-                "sad": Expression.SAD,
-            }
-            expression = mood_map.get(mood, Expression.IDLE)
+        activity = self.get_activity() if self.get_activity else None
+        energy = self.get_energy() if self.get_energy else None
+        mood = self.get_mood() if self.get_mood else None
+
+        # Inputs rarely change between frames; only re-derive when they do
+        inputs = (activity, energy, mood)
+        if inputs != self._expr_inputs:
+            self._expr_inputs = inputs
+            self._expr_target = _expression_for(activity, energy, mood)
+        expression = self._expr_target
+
+        # Mid-blink, remember the target and apply it when the eyes reopen
+        if self._blink_start is not None:
+            self._blink_saved_expr = expression
+            return
 
         # Apply expression (avoid redundant updates)
         if self.renderer.state.expression != expression:
@@ -496,7 +956,15 @@ class FaceAnimator:
 
     def _update_blink(self) -> None:
         """Handle natural blinking."""
-        now = time.time()
+        now = time.monotonic()
+
+        # Reopen the eyes once the blink has lasted long enough
+        if self._blink_start is not None:
+            if now - self._blink_start >= BLINK_DURATION:
+                with self._lock:
+                    self.renderer.set_expression(self._blink_saved_expr)
+                self._blink_start = None
+            return
 
         # Random blink interval (2-5 seconds)
         if now - self._last_blink > self._blink_interval:
@@ -507,16 +975,15 @@ class FaceAnimator:
             if current_expr not in (Expression.SLEEPING, Expression.BLINK):
                 with self._lock:
                     self.renderer.set_expression(Expression.BLINK)
-                time.sleep(0.1)  # Brief blink
-                with self._lock:
-                    self.renderer.set_expression(current_expr)
+                self._blink_saved_expr = current_expr
+                self._blink_start = now
 
             self._last_blink = now
             self._blink_interval = random.uniform(2, 5)
 
     def _update_look(self) -> None:
         """Handle eye movement (looking around)."""
-        now = time.time()
+        now = time.monotonic()
 
         # Occasionally pick a new look target
         if now - self._last_look > self._look_interval:
@@ -528,51 +995,147 @@ class FaceAnimator:
             self._last_look = now
             self._look_interval = random.uniform(1.5, 4)
 
-        # Smoothly interpolate to target
-        lerp_speed = 0.1
-        self._current_look = (
-            self._current_look[0] + (self._target_look[0] - self._current_look[0]) * lerp_speed,
-            self._current_look[1] + (self._target_look[1] - self._current_look[1]) * lerp_speed,
+    def _update_motion(self) -> None:
+        """Ease the gaze toward its target and animate the mouth when speaking."""
+        look_x, look_y = self._current_look
+        target_x, target_y = self._target_look
+        look_x, look_y, self._speak_phase, openness = _step_motion(
+            look_x, look_y, target_x, target_y, self._speak_phase, self._speaking,
         )
+        self._current_look = (look_x, look_y)
 
         with self._lock:
-            self.renderer.look_at(*self._current_look)
-
-    def _update_speaking(self) -> None:
-        """Handle mouth animation when speaking."""
-        if self._speaking:
-            # Oscillate mouth open/close
-            self._speak_phase += 0.3
-            openness = (math.sin(self._speak_phase) + 1) / 2 * 0.8
-            with self._lock:
-                self.renderer.state.mouth_open = openness
+            self.renderer.look_at(look_x, look_y)
+            self.renderer.state.mouth_open = openness
+
+    def _to_bgra(self, img: Image.Image) -> bytes:
+        """Convert an RGB frame to 32-bit BGRA framebuffer bytes."""
+        if self._bgra_buf is not None:
+            # Single pass channel swap into the preallocated buffer
+            rgb = np.asarray(img)
+            height, width, _ = rgb.shape
+            buf = self._bgra_buf[:height, :width]
+            if NUMBA_AVAILABLE:
+                _rgb_to_bgra(rgb, buf)
+                return buf.tobytes()
+            buf[..., 0] = rgb[..., 2]
+            buf[..., 1] = rgb[..., 1]
+            buf[..., 2] = rgb[..., 0]
+            return buf.tobytes()
+
+        # Let PIL's raw encoder reorder channels in one C-level pass
+        return img.convert('RGBA').tobytes('raw', 'BGRA')
+
+    def _to_rgb565(self, img: Image.Image) -> bytes:
+        """Quantize an RGB frame to 16-bit RGB565 framebuffer bytes."""
+        pb = np.asarray(img, dtype=np.uint16)
+        color = ((pb[..., 0] & 0xF8) << 8) | ((pb[..., 1] & 0xFC) << 3) | (pb[..., 2] >> 3)
+        return color.astype('<u2').tobytes()
+
+    def _framebuffer_depth(self, fd: int) -> int:
+        """Read the framebuffer's bits per pixel, assuming 32 if it can't be queried."""
+        try:
+            info = fcntl.ioctl(fd, FBIOGET_VSCREENINFO, bytes(FB_VAR_SCREENINFO_SIZE))
+        except OSError:
+            return 32
+        return struct.unpack_from('I', info, 24)[0]
+
+    def _open_framebuffer(self) -> None:
+        """Map the framebuffer so each frame is a single in-place copy."""
+        if self._fb_mmap is not None:
+            return
+
+        try:
+            fd = os.open(self._fb_path, os.O_RDWR)
+        except PermissionError:
+            logger.warning("No permission to write to framebuffer (face will not be shown)")
+            return
+        except FileNotFoundError:
+            logger.warning("Framebuffer not found - not running on Pi? (face will not be shown)")
+            return
+        except OSError as e:
+            logger.debug(f"Framebuffer open failed: {e}")
+            return
+
+        depth = self._framebuffer_depth(fd)
+        if depth == 16 and NUMPY_AVAILABLE:
+            # RGB565 halves the bytes pushed per frame
+            self._fb_bytes_pp = 2
         else:
-            with self._lock:
-                self.renderer.state.mouth_open = 0
+            if depth != 32:
+                logger.warning(f"Framebuffer is {depth}-bit; writing 32-bit BGRA anyway")
+            self._fb_bytes_pp = 4
 
-    def _display_to_framebuffer(self, img: Image.Image) -> None:
-        """Write image directly to framebuffer."""
         try:
-            # Convert to RGB565 or BGRA depending on framebuffer format
-            # Most Pi setups use 32-bit BGRA
-            img_rgba = img.convert('RGBA')
+            self._fb_mmap = mmap.mmap(fd, DISPLAY_WIDTH * DISPLAY_HEIGHT * self._fb_bytes_pp)
+        except (OSError, ValueError) as e:
+            logger.debug(f"Framebuffer mmap failed: {e}")
+            os.close(fd)
+            return
 
-            # Swap R and B for BGRA format
-            r, g, b, a = img_rgba.split()
-            img_bgra = Image.merge('RGBA', (b, g, r, a))
+        self._fb_fd = fd
 
-            # Write to framebuffer
-            with open(self._fb_path, 'wb') as fb:
-                fb.write(img_bgra.tobytes())
+    def _close_framebuffer(self) -> None:
+        """Release the framebuffer mapping."""
+        if self._fb_mmap is not None:
+            try:
+                self._fb_mmap.close()
+            except (OSError, BufferError):
+                pass
+            self._fb_mmap = None
+        if self._fb_fd is not None:
+            try:
+                os.close(self._fb_fd)
+            except OSError:
+                pass
+            self._fb_fd = None
+
+    def _frame_bytes(
+        self, img: Image.Image, rect: Tuple[int, int, int, int] = FULL_SCREEN_RECT
+    ) -> Optional[Tuple[Tuple[int, int, int, int], bytes]]:
+        """
+        Convert the given region of a frame to framebuffer bytes.
+
+        Returns (rect, data), or None if there is no display output or the
+        region is empty.
+        """
+        if self._fb_mmap is None and self._kms_screen is None:
+            return None
+        x0, y0, x1, y1 = rect
+        if x1 <= x0 or y1 <= y0:
+            return None
+        if rect != FULL_SCREEN_RECT:
+            img = img.crop(rect)
+        if self._kms_screen is not None:
+            # SDL takes packed RGB as-is
+            return rect, img.tobytes()
+        if self._fb_bytes_pp == 2:
+            return rect, self._to_rgb565(img)
+        # Most Pi setups use 32-bit BGRA
+        return rect, self._to_bgra(img)
+
+    def _write_framebuffer(self, frame: Optional[Tuple[Tuple[int, int, int, int], bytes]]) -> None:
+        """Copy a prepared frame region into the framebuffer."""
+        if self._fb_mmap is None or frame is None:
+            return
+
+        try:
+            (x0, y0, x1, y1), data = frame
+            bpp = self._fb_bytes_pp
+            stride = DISPLAY_WIDTH * bpp
+            if x0 == 0 and x1 == DISPLAY_WIDTH:
+                # Full-width band is contiguous in the framebuffer
+                start = y0 * stride
+                self._fb_mmap[start:start + len(data)] = data
+            else:
+                fb = self._fb_mmap
+                src = memoryview(data)
+                row_bytes = (x1 - x0) * bpp
+                offset = y0 * stride + x0 * bpp
+                for i in range(0, len(data), row_bytes):
+                    fb[offset:offset + row_bytes] = src[i:i + row_bytes]
+                    offset += stride
 
-        except PermissionError:
-            if not self._fb_warned:
-                logger.warning("No permission to write to framebuffer (will not repeat)")
-                self._fb_warned = True
-        except FileNotFoundError:
-            if not self._fb_warned:
-                logger.warning("Framebuffer not found - not running on Pi? (will not repeat)")
-                self._fb_warned = True
         except Exception as e:
             if not self._fb_warned:
                 logger.debug(f"Framebuffer write failed: {e}")
@@ -587,6 +1150,7 @@ def get_face_animator(
     get_mood: Optional[Callable[[], str]] = None,
     get_activity: Optional[Callable[[], Optional[str]]] = None,
     get_energy: Optional[Callable[[], float]] = None,
+    backend: str = "framebuffer",
 ) -> FaceAnimator:
     """Get or create the face animator singleton."""
     global _animator
@@ -595,6 +1159,7 @@ def get_face_animator(
             get_mood=get_mood,
             get_activity=get_activity,
             get_energy=get_energy,
+            backend=backend,
         )
     return _animator
 
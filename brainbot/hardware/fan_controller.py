@@ -1,13 +1,14 @@
 """PWM fan controller for temperature management."""
 
 import logging
-import os
 import threading
 import time
 from typing import Optional
 
 logger = logging.getLogger(__name__)
 
+THERMAL_FILE = "/sys/class/thermal/thermal_zone0/temp"
+
 # Try to import GPIO library
 try:
     import RPi.GPIO as GPIO
@@ -28,6 +29,7 @@ class FanController:
     DEFAULT_MAX_TEMP = 70  # Full speed at 70°C
     DEFAULT_MIN_SPEED = 30  # Minimum fan speed when active
     PWM_FREQUENCY = 25000  # 25kHz for quiet operation
+    SPEED_HYSTERESIS = 3  # Auto mode ignores speed changes smaller than this
 
     def __init__(
         self,
@@ -56,6 +58,14 @@ class FanController:
         self._auto_thread: Optional[threading.Thread] = None
         self._stop_auto = threading.Event()
 
+        # Thermal sensor stays open; each read is seek(0) + read()
+        self._thermal_file = None
+        self._thermal_lock = threading.Lock()
+        try:
+            self._thermal_file = open(THERMAL_FILE, "rb")
+        except OSError:
+            logger.debug(f"CPU temperature not available ({THERMAL_FILE})")
+
         if GPIO_AVAILABLE:
             self._initialize()
         else:
@@ -126,13 +136,13 @@ class FanController:
 
                 if temp is None:
                     # Can't read temperature, set to medium speed
-                    self.set_speed(50)
+                    speed = 50
                 elif temp < self.min_temp:
                     # Below minimum, turn off
-                    self.set_speed(0)
+                    speed = 0
                 elif temp >= self.max_temp:
                     # At or above max, full speed
-                    self.set_speed(100)
+                    speed = 100
                 else:
                     # Calculate proportional speed
                     temp_range = self.max_temp - self.min_temp
@@ -140,6 +150,13 @@ class FanController:
                     speed_range = 100 - self.min_speed
 
                     speed = self.min_speed + int((temp_offset / temp_range) * speed_range)
+
+                # Hysteresis: ignore small drifts, but always honor off/full
+                change = abs(speed - self._current_speed)
+                if change >= self.SPEED_HYSTERESIS or (
+                    speed in (0, 100) and change > 0
+                ):
+                    logger.info(f"Fan auto: {temp}°C -> {speed}%")
                     self.set_speed(speed)
 
             except Exception as e:
@@ -150,17 +167,16 @@ class FanController:
 
     def _get_cpu_temperature(self) -> Optional[float]:
         """Get CPU temperature in Celsius."""
-        thermal_file = "/sys/class/thermal/thermal_zone0/temp"
+        if self._thermal_file is None:
+            return None
 
-        if os.path.exists(thermal_file):
-            try:
-                with open(thermal_file) as f:
-                    temp_millicelsius = int(f.read().strip())
-                    return temp_millicelsius / 1000.0
-            except Exception:
-                pass
-
-        return None
+        try:
+            with self._thermal_lock:
+                self._thermal_file.seek(0)
+                temp_millicelsius = int(self._thermal_file.read().strip())
+            return temp_millicelsius / 1000.0
+        except Exception:
+            return None
 
     def get_temperature(self) -> Optional[float]:
         """Get current CPU temperature."""
@@ -187,6 +203,13 @@ class FanController:
         if self._pwm:
             self._pwm.stop()
 
+        if self._thermal_file is not None:
+            try:
+                self._thermal_file.close()
+            except OSError:
+                pass
+            self._thermal_file = None
+
         if GPIO_AVAILABLE:
             try:
                 GPIO.cleanup(self.pin)
@@ -1,7 +1,13 @@
 """1-inch B&W OLED display driver (SSD1306) using luma.oled."""
 
+import functools
 import logging
-from typing import Optional
+import threading
+import time
+from collections import OrderedDict
+from typing import Callable, Optional, Sequence, Tuple
+
+from ._fonts import get_font
 
 logger = logging.getLogger(__name__)
 
@@ -12,6 +18,12 @@ try:
 except ImportError:
     PIL_AVAILABLE = False
 
+try:
+    import numpy as np
+    NUMPY_AVAILABLE = True
+except ImportError:
+    NUMPY_AVAILABLE = False
+
 try:
     from luma.core.interface.serial import i2c
     from luma.oled.device import ssd1306
@@ -19,6 +31,27 @@ try:
 except ImportError:
     HARDWARE_AVAILABLE = False
 
+try:
+    from smbus2 import SMBus, i2c_msg
+    SMBUS2_AVAILABLE = True
+except ImportError:
+    SMBUS2_AVAILABLE = False
+
+# Fixed geometry for the state frames, worked out once at import
+SPINNER_BOX = (100, 25, 120, 45)
+SPEAKING_WAVES = tuple(
+    ((100 + offset, 32 - height // 2), (100 + offset, 32 + height // 2))
+    for offset, height in ((0, 10), (8, 15), (16, 20))
+)
+
+
+@functools.lru_cache(maxsize=128)
+def _split_chat(message: str) -> Tuple[str, str]:
+    """Split a chat message over two display lines, ellipsizing past 40 chars."""
+    if len(message) > 40:
+        return message[:20], message[20:37] + "..."
+    return message[:20], message[20:40]
+
 
 class LCD1Inch:
     """
@@ -26,11 +59,24 @@ class LCD1Inch:
 
     Used for quick status updates and minimal information display.
     Displays BrainBot's current state, incoming messages, and activity.
+
+    Drawing methods assume the hardware initialized; create instances with
+    create_lcd_1inch(), which substitutes SimLCD1Inch when it can't be.
     """
 
     DEFAULT_WIDTH = 128
     DEFAULT_HEIGHT = 64
     DEFAULT_I2C_ADDRESS = 0x3C
+    FRAME_CACHE_SIZE = 8  # Rendered 1-bit frames kept (~1 KB each)
+    PARTIAL_UPDATE_MAX = 0.75  # Above this fraction of the screen, send it all
+    FLUSH_INTERVAL = 0.05  # Minimum seconds between I2C transfers (~20 Hz)
+    MAX_PROGRESS_BARS = 3  # Bars that fit in show_progress_multi
+
+    # SSD1306 addressing commands
+    SET_COLUMN_ADDRESS = 0x21
+    SET_PAGE_ADDRESS = 0x22
+    COMMAND_CONTROL_BYTE = b"\x00"  # I2C control byte: commands follow
+    DATA_CONTROL_BYTE = b"\x40"  # I2C control byte: display data follows
 
     def __init__(
         self,
@@ -58,6 +104,36 @@ class LCD1Inch:
         self._font_small: Optional["ImageFont.FreeTypeFont"] = None
         self._initialized = False
 
+        # Rendered frames keyed by (method, args); the last key shown is
+        # remembered so an identical refresh skips the I2C transfer too
+        self._frame_cache: "OrderedDict[tuple, Image.Image]" = OrderedDict()
+        self._last_key: Optional[tuple] = None
+
+        # Page-major bytes last sent to the panel, for dirty-rect updates.
+        # Frames are packed here and written straight to the SSD1306 RAM;
+        # other devices go through luma's display()
+        self._prev_pages = None
+        self._direct_write = False
+        self._smbus = None  # Own bus handle for single-transaction data writes
+
+        # Scratch canvas reused by uncached frames (progress bars); cached
+        # frames keep their own images
+        self._image: Optional["Image.Image"] = None
+        self._draw: Optional["ImageDraw.ImageDraw"] = None
+        if PIL_AVAILABLE:
+            self._image = Image.new("1", (self.width, self.height), 0)
+            self._draw = ImageDraw.Draw(self._image)
+
+        # Frames are handed to a flush thread that sends at most one per
+        # FLUSH_INTERVAL, so bursts of updates collapse into the newest frame
+        self._lock = threading.Lock()
+        self._pending: Optional["Image.Image"] = None
+        self._pending_event = threading.Event()
+        self._flush_thread: Optional[threading.Thread] = None
+
+        # Idle frame chrome ("BrainBot" / "Ready..."), rendered on first use
+        self._idle_template: Optional["Image.Image"] = None
+
         if HARDWARE_AVAILABLE and PIL_AVAILABLE:
             self._initialize()
         else:
@@ -73,17 +149,19 @@ class LCD1Inch:
         try:
             serial = i2c(port=self.bus_number, address=self.i2c_address)
             self._device = ssd1306(serial, width=self.width, height=self.height)
+            self._direct_write = NUMPY_AVAILABLE and isinstance(self._device, ssd1306)
+            if self._direct_write and SMBUS2_AVAILABLE:
+                try:
+                    self._smbus = SMBus(self.bus_number)
+                except OSError as e:
+                    logger.debug(f"LCD1Inch: no direct I2C bus ({e}), using luma for data")
 
             # Load fonts
-            try:
-                font_path = "/usr/share/fonts/truetype/dejavu/DejaVuSans.ttf"
-                self._font = ImageFont.truetype(font_path, 14)
-                self._font_small = ImageFont.truetype(font_path, 10)
-            except Exception:
-                self._font = ImageFont.load_default()
-                self._font_small = ImageFont.load_default()
+            self._font = get_font(14)
+            self._font_small = get_font(10)
 
             self._initialized = True
+            self._start_flush_thread()
             logger.info("LCD1Inch initialized (luma.oled SSD1306)")
             return True
 
@@ -91,6 +169,102 @@ class LCD1Inch:
             logger.error(f"Failed to initialize LCD1Inch: {e}")
             return False
 
+    def _start_flush_thread(self) -> None:
+        """Start the background thread that pushes frames to the panel."""
+        self._flush_thread = threading.Thread(target=self._flush_loop, daemon=True)
+        self._flush_thread.start()
+
+    def _flush_loop(self) -> None:
+        """Send the newest pending frame, then rest for FLUSH_INTERVAL."""
+        while True:
+            self._pending_event.wait()
+            with self._lock:
+                self._pending_event.clear()
+                image, self._pending = self._pending, None
+                if image is not None:
+                    try:
+                        self._flush(image)
+                    except Exception as e:
+                        logger.error(f"Failed to update display: {e}")
+            time.sleep(self.FLUSH_INTERVAL)
+
+    def _queue(self, image: "Image.Image") -> None:
+        """Make image the next frame to send (caller holds the lock)."""
+        self._pending = image
+        self._pending_event.set()
+
+    def _show(self, key: tuple, render: Callable[[], "Image.Image"]) -> None:
+        """Display the frame for key, rendering it only on a cache miss."""
+        with self._lock:
+            if key == self._last_key:
+                return
+
+            image = self._frame_cache.get(key)
+            if image is None:
+                image = render()
+                self._frame_cache[key] = image
+                if len(self._frame_cache) > self.FRAME_CACHE_SIZE:
+                    self._frame_cache.popitem(last=False)
+            else:
+                self._frame_cache.move_to_end(key)
+
+            self._queue(image)
+            self._last_key = key
+
+    def _flush(self, image: "Image.Image") -> None:
+        """
+        Send a frame to the panel.
+
+        Only the page/column window that changed since the last frame is
+        written, unless it covers most of the screen.
+        """
+        if not self._direct_write:
+            self._device.display(image)
+            return
+
+        # SSD1306 RAM is 8-pixel-tall pages, one byte per column, LSB on top
+        bits = np.asarray(self._device.preprocess(image), dtype=bool)
+        pages = np.packbits(
+            bits.reshape(self.height // 8, 8, self.width), axis=1, bitorder="little"
+        ).reshape(self.height // 8, self.width)
+
+        prev, self._prev_pages = self._prev_pages, None
+        page0, page1 = 0, pages.shape[0] - 1
+        col0, col1 = 0, pages.shape[1] - 1
+        if prev is not None:
+            diff = pages != prev
+            if not diff.any():
+                self._prev_pages = pages
+                return
+            rows = np.flatnonzero(diff.any(axis=1))
+            cols = np.flatnonzero(diff.any(axis=0))
+            if (rows[-1] - rows[0] + 1) * (cols[-1] - cols[0] + 1) <= self.PARTIAL_UPDATE_MAX * pages.size:
+                page0, page1 = int(rows[0]), int(rows[-1])
+                col0, col1 = int(cols[0]), int(cols[-1])
+
+        # Narrower panels are offset within the 128-column RAM
+        offset = getattr(self._device, "_colstart", 0)
+        window = (
+            self.SET_COLUMN_ADDRESS, col0 + offset, col1 + offset,
+            self.SET_PAGE_ADDRESS, page0, page1,
+        )
+        payload = pages[page0:page1 + 1, col0:col1 + 1].tobytes()
+        if self._smbus is not None:
+            # Address window and pixel data as two messages of one
+            # i2c_rdwr, so a frame is a single ioctl
+            self._smbus.i2c_rdwr(
+                i2c_msg.write(self.i2c_address, self.COMMAND_CONTROL_BYTE + bytes(window)),
+                i2c_msg.write(self.i2c_address, self.DATA_CONTROL_BYTE + payload),
+            )
+        else:
+            self._device.command(*window)
+            self._device.data(payload)
+        self._prev_pages = pages
+
+    def _clear_buf(self) -> None:
+        """Blank the scratch canvas in place."""
+        self._draw.rectangle((0, 0, self.width, self.height), fill=0)
+
     def display_text(self, line1: str, line2: str = "", line3: str = "") -> None:
         """
         Display up to three lines of text.
@@ -100,32 +274,28 @@ class LCD1Inch:
             line2: Second line of text
             line3: Third line of text
         """
-        if not self._initialized:
-            logger.debug(f"LCD1Inch (sim): {line1} | {line2} | {line3}")
-            return
-
         try:
-            # Create image
-            image = Image.new("1", (self.width, self.height), 0)
-            draw = ImageDraw.Draw(image)
-
-            # Draw text lines
-            y_positions = [2, 24, 46]
-            lines = [line1, line2, line3]
+            self._show(
+                ("text", line1, line2, line3),
+                lambda: self._render_text(line1, line2, line3),
+            )
+        except Exception as e:
+            logger.error(f"Failed to display text: {e}")
 
-            for i, (line, y) in enumerate(zip(lines, y_positions)):
-                if line:
-                    # Truncate to fit
-                    max_chars = 18 if i == 0 else 21
-                    text = line[:max_chars]
-                    font = self._font if i == 0 else self._font_small
-                    draw.text((2, y), text, font=font, fill=255)
+    def _render_text(self, line1: str, line2: str, line3: str) -> "Image.Image":
+        """Render up to three lines of text."""
+        image = Image.new("1", (self.width, self.height), 0)
+        draw = ImageDraw.Draw(image)
 
-            # Display
-            self._device.display(image)
+        # Title line in the large font, two detail lines below; truncated to fit
+        if line1:
+            draw.text((2, 2), line1[:18], font=self._font, fill=255)
+        if line2:
+            draw.text((2, 24), line2[:21], font=self._font_small, fill=255)
+        if line3:
+            draw.text((2, 46), line3[:21], font=self._font_small, fill=255)
 
-        except Exception as e:
-            logger.error(f"Failed to display text: {e}")
+        return image
 
     def display_status(self, status: str, value: str = "") -> None:
         """
@@ -145,61 +315,70 @@ class LCD1Inch:
             source: Message source (e.g., "Slack", "Terminal")
             message: The message text (will be truncated)
         """
-        # Truncate message to fit on two lines
-        msg_preview = message[:40] + "..." if len(message) > 40 else message
-        line2 = msg_preview[:20]
-        line3 = msg_preview[20:40] if len(msg_preview) > 20 else ""
+        line2, line3 = _split_chat(message)
         self.display_text(f"[{source}]", line2, line3)
 
     def display_thinking(self) -> None:
         """Display thinking/processing state."""
-        if not self._initialized:
-            logger.debug("LCD1Inch (sim): Thinking...")
-            return
-
         try:
-            image = Image.new("1", (self.width, self.height), 0)
-            draw = ImageDraw.Draw(image)
+            self._show(("thinking",), self._render_thinking)
+        except Exception as e:
+            logger.error(f"Failed to display thinking: {e}")
 
-            # Draw "Thinking..." with animation dots indicator
-            draw.text((20, 20), "Thinking", font=self._font, fill=255)
-            draw.text((20, 40), "...", font=self._font, fill=255)
+    def _render_thinking(self) -> "Image.Image":
+        """Render the thinking frame."""
+        image = Image.new("1", (self.width, self.height), 0)
+        draw = ImageDraw.Draw(image)
 
-            # Draw spinning indicator
-            draw.ellipse([100, 25, 120, 45], outline=255)
-            draw.arc([100, 25, 120, 45], 0, 90, fill=255, width=2)
+        # Draw "Thinking..." with animation dots indicator
+        draw.text((20, 20), "Thinking", font=self._font, fill=255)
+        draw.text((20, 40), "...", font=self._font, fill=255)
 
-            self._device.display(image)
+        # Draw spinning indicator
+        draw.ellipse(SPINNER_BOX, outline=255)
+        draw.arc(SPINNER_BOX, 0, 90, fill=255, width=2)
 
-        except Exception as e:
-            logger.error(f"Failed to display thinking: {e}")
+        return image
 
     def display_speaking(self) -> None:
         """Display speaking/responding state."""
-        if not self._initialized:
-            logger.debug("LCD1Inch (sim): Speaking...")
-            return
-
         try:
-            image = Image.new("1", (self.width, self.height), 0)
-            draw = ImageDraw.Draw(image)
+            self._show(("speaking",), self._render_speaking)
+        except Exception as e:
+            logger.error(f"Failed to display speaking: {e}")
 
-            draw.text((20, 20), "Speaking", font=self._font, fill=255)
+    def _render_speaking(self) -> "Image.Image":
+        """Render the speaking frame."""
+        image = Image.new("1", (self.width, self.height), 0)
+        draw = ImageDraw.Draw(image)
 
-            # Draw sound waves
-            for i, offset in enumerate([0, 8, 16]):
-                height = 10 + (i * 5)
-                x = 100 + offset
-                draw.line([(x, 32 - height // 2), (x, 32 + height // 2)], fill=255, width=2)
+        draw.text((20, 20), "Speaking", font=self._font, fill=255)
 
-            self._device.display(image)
+        # Draw sound waves
+        for wave in SPEAKING_WAVES:
+            draw.line(wave, fill=255, width=2)
 
-        except Exception as e:
-            logger.error(f"Failed to display speaking: {e}")
+        return image
 
     def display_idle(self, mood: str = "content") -> None:
         """Display idle state with mood."""
-        self.display_text("BrainBot", f"Mood: {mood}", "Ready...")
+        mood_line = f"Mood: {mood}"
+        try:
+            # Same key as the equivalent display_text call
+            self._show(
+                ("text", "BrainBot", mood_line, "Ready..."),
+                lambda: self._render_idle(mood_line),
+            )
+        except Exception as e:
+            logger.error(f"Failed to display idle: {e}")
+
+    def _render_idle(self, mood_line: str) -> "Image.Image":
+        """Render the idle frame by adding the mood line to the fixed chrome."""
+        if self._idle_template is None:
+            self._idle_template = self._render_text("BrainBot", "", "Ready...")
+        image = self._idle_template.copy()
+        ImageDraw.Draw(image).text((2, 24), mood_line[:21], font=self._font_small, fill=255)
+        return image
 
     def show_progress(self, label: str, progress: float) -> None:
         """
@@ -209,41 +388,93 @@ class LCD1Inch:
             label: Label for the progress bar
             progress: Progress value 0.0 to 1.0
         """
-        if not self._initialized:
-            logger.debug(f"LCD1Inch (sim): {label} [{int(progress * 100)}%]")
-            return
+        # Whole percents, so float jitter doesn't count as a new frame
+        percent = int(progress * 100)
+        key = ("progress", label, percent)
 
         try:
-            image = Image.new("1", (self.width, self.height), 0)
-            draw = ImageDraw.Draw(image)
+            # The scratch canvas may be mid-send; draw only while holding the lock
+            with self._lock:
+                if key == self._last_key:
+                    return
 
-            # Label
-            draw.text((2, 5), label[:18], font=self._font, fill=255)
+                self._clear_buf()
+                draw = self._draw
 
-            # Progress bar
-            bar_width = int((self.width - 20) * min(1.0, max(0.0, progress)))
-            draw.rectangle([10, 35, self.width - 10, 50], outline=255)
-            if bar_width > 0:
-                draw.rectangle([12, 37, 12 + bar_width, 48], fill=255)
+                # Label
+                draw.text((2, 5), label[:18], font=self._font, fill=255)
 
-            # Percentage
-            percent_text = f"{int(progress * 100)}%"
-            draw.text((self.width // 2 - 15, 52), percent_text, font=self._font_small, fill=255)
+                # Progress bar
+                bar_width = int((self.width - 20) * min(1.0, max(0.0, percent / 100)))
+                draw.rectangle([10, 35, self.width - 10, 50], outline=255)
+                if bar_width > 0:
+                    draw.rectangle([12, 37, 12 + bar_width, 48], fill=255)
 
-            self._device.display(image)
+                # Percentage
+                draw.text((self.width // 2 - 15, 52), f"{percent}%", font=self._font_small, fill=255)
+
+                self._queue(self._image)
+                self._last_key = key
 
         except Exception as e:
             logger.error(f"Failed to show progress: {e}")
 
-    def clear(self) -> None:
-        """Clear the display."""
-        if not self._initialized:
-            logger.debug("LCD1Inch (sim): cleared")
+    def show_progress_multi(self, items: Sequence[Tuple[str, float]]) -> None:
+        """
+        Show several progress bars at once, one per row.
+
+        Args:
+            items: (label, progress 0.0 to 1.0) pairs; only the first three
+                are shown
+        """
+        items = list(items)[:self.MAX_PROGRESS_BARS]
+        if not items:
             return
 
         try:
-            image = Image.new("1", (self.width, self.height), 0)
-            self._device.display(image)
+            labels = [label[:7] for label, _ in items]
+            row_height = self.height // len(items)
+            bar_left, bar_right, bar_height = 48, self.width - 3, 8
+            bar_tops = [i * row_height + (row_height - bar_height) // 2 for i in range(len(items))]
+            inner = bar_right - bar_left - 3
+
+            if NUMPY_AVAILABLE:
+                # All bars as one vectorized mask: outlines, then fills
+                values = np.clip(np.array([p for _, p in items], dtype=np.float32), 0.0, 1.0)
+                widths = (values * inner).astype(np.int32)
+                rows = np.array(bar_tops)[:, None] + np.arange(bar_height)
+                cols = np.arange(self.width)
+                pixels = np.zeros((self.height, self.width), dtype=bool)
+                pixels[rows[:, [0, -1]], bar_left:bar_right + 1] = True
+                pixels[rows, bar_left] = True
+                pixels[rows, bar_right] = True
+                fill = (cols >= bar_left + 2) & (cols < bar_left + 2 + widths[:, None])
+                pixels[rows[:, 2:-2]] |= fill[:, None, :]
+                image = Image.fromarray(pixels)
+            else:
+                image = Image.new("1", (self.width, self.height), 0)
+                draw = ImageDraw.Draw(image)
+                for (_, progress), top in zip(items, bar_tops):
+                    width = int(inner * min(1.0, max(0.0, progress)))
+                    draw.rectangle([bar_left, top, bar_right, top + bar_height - 1], outline=255)
+                    if width > 0:
+                        draw.rectangle([bar_left + 2, top + 2, bar_left + 1 + width, top + bar_height - 3], fill=255)
+
+            draw = ImageDraw.Draw(image)
+            for label, top in zip(labels, bar_tops):
+                draw.text((2, top - 2), label, font=self._font_small, fill=255)
+
+            with self._lock:
+                self._queue(image)
+                self._last_key = None
+
+        except Exception as e:
+            logger.error(f"Failed to show progress: {e}")
+
+    def clear(self) -> None:
+        """Clear the display."""
+        try:
+            self._show(("clear",), lambda: Image.new("1", (self.width, self.height), 0))
         except Exception as e:
             logger.error(f"Failed to clear display: {e}")
 
@@ -252,6 +483,53 @@ class LCD1Inch:
         return self._initialized
 
 
+class SimLCD1Inch(LCD1Inch):
+    """Stand-in for LCD1Inch without the display: logs what would be shown."""
+
+    def __init__(
+        self,
+        width: int = LCD1Inch.DEFAULT_WIDTH,
+        height: int = LCD1Inch.DEFAULT_HEIGHT,
+        i2c_address: int = LCD1Inch.DEFAULT_I2C_ADDRESS,
+        bus_number: int = 1,
+    ):
+        self.width = width
+        self.height = height
+        self.i2c_address = i2c_address
+        self.bus_number = bus_number
+        self._initialized = False
+
+    def display_text(self, line1: str, line2: str = "", line3: str = "") -> None:
+        logger.debug(f"LCD1Inch (sim): {line1} | {line2} | {line3}")
+
+    def display_thinking(self) -> None:
+        logger.debug("LCD1Inch (sim): Thinking...")
+
+    def display_speaking(self) -> None:
+        logger.debug("LCD1Inch (sim): Speaking...")
+
+    def display_idle(self, mood: str = "content") -> None:
+        logger.debug(f"LCD1Inch (sim): BrainBot | Mood: {mood} | Ready...")
+
+    def show_progress(self, label: str, progress: float) -> None:
+        logger.debug(f"LCD1Inch (sim): {label} [{int(progress * 100)}%]")
+
+    def show_progress_multi(self, items: Sequence[Tuple[str, float]]) -> None:
+        summary = ", ".join(f"{label} [{int(p * 100)}%]" for label, p in items)
+        logger.debug(f"LCD1Inch (sim): {summary}")
+
+    def clear(self) -> None:
+        logger.debug("LCD1Inch (sim): cleared")
+
+
+def create_lcd_1inch() -> LCD1Inch:
+    """Create an LCD1Inch, or a SimLCD1Inch if the display can't be driven."""
+    lcd = LCD1Inch()
+    if lcd.is_available():
+        return lcd
+    return SimLCD1Inch()
+
+
 # Singleton instance
 _lcd_instance: Optional[LCD1Inch] = None
 
@@ -261,7 +539,7 @@ def get_lcd_1inch() -> Optional[LCD1Inch]:
     global _lcd_instance
     if _lcd_instance is None:
         try:
-            _lcd_instance = LCD1Inch()
+            _lcd_instance = create_lcd_1inch()
         except Exception as e:
             logger.warning(f"Could not initialize LCD1Inch: {e}")
             return None
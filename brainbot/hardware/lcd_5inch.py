@@ -1,9 +1,16 @@
 """5-inch LCD display driver."""
 
+import functools
 import logging
+import mmap
+import os
 import textwrap
+import threading
+from collections import OrderedDict
 from typing import Optional, Tuple
 
+from ._fonts import font_path, get_font
+
 logger = logging.getLogger(__name__)
 
 # Try to import hardware libraries
@@ -13,6 +20,12 @@ try:
 except ImportError:
     PIL_AVAILABLE = False
 
+try:
+    import numpy as np
+    NUMPY_AVAILABLE = True
+except ImportError:
+    NUMPY_AVAILABLE = False
+
 # Try to import display library (varies by display type)
 try:
     # Try for SPI-based 5" display
@@ -22,6 +35,83 @@ except ImportError:
     SPI_AVAILABLE = False
 
 
+@functools.lru_cache(maxsize=64)
+def _measure(font: "ImageFont.ImageFont", text: str) -> Tuple[int, int, int, int]:
+    """Bounding box of text in font; fonts are shared instances, so cache by identity."""
+    return font.getbbox(text)
+
+
+@functools.lru_cache(maxsize=64)
+def _advance(font: "ImageFont.ImageFont", text: str) -> float:
+    """Horizontal advance of text in font (no glyph bitmaps or bbox needed)."""
+    return font.getlength(text)
+
+
+def _pack_words(words: list[str], width: int) -> Optional[list[str]]:
+    """
+    Greedily pack single-spaced words into lines of at most width chars.
+
+    Matches textwrap.wrap for plain words; returns None when a word would
+    need textwrap's hyphen or long-word splitting.
+    """
+    lines = []
+    line: list[str] = []
+    line_len = 0
+    for word in words:
+        if len(word) > width or "-" in word:
+            return None
+        if line and line_len + 1 + len(word) > width:
+            lines.append(" ".join(line))
+            line, line_len = [], 0
+        line_len += len(word) + 1 if line else len(word)
+        line.append(word)
+    if line:
+        lines.append(" ".join(line))
+    return lines
+
+
+def _break_lines(widths: list[float], space: float, max_width: float) -> list[int]:
+    """
+    Choose line breaks that minimize raggedness (Knuth-Plass, no hyphenation).
+
+    Minimizes the sum of squared trailing space over every line but the last,
+    rather than filling each line greedily and leaving a ragged right edge.
+
+    Args:
+        widths: Width of each word; none may exceed max_width
+        space: Width of the space between words
+        max_width: Line width in pixels
+
+    Returns:
+        Index of the first word on each line
+    """
+    n = len(widths)
+    offsets = [0.0]
+    for width in widths:
+        offsets.append(offsets[-1] + width)
+
+    # cost[j]: least total badness for setting words[:j]; start[j]: where
+    # the last of those lines begins
+    cost = [0.0] + [float("inf")] * n
+    start = [0] * (n + 1)
+    for j in range(1, n + 1):
+        for i in range(j - 1, -1, -1):
+            line_width = offsets[j] - offsets[i] + space * (j - i - 1)
+            if line_width > max_width and i < j - 1:
+                break
+            slack = 0.0 if j == n else max_width - line_width
+            total = cost[i] + slack * slack
+            if total < cost[j]:
+                cost[j], start[j] = total, i
+
+    starts = []
+    j = n
+    while j > 0:
+        j = start[j]
+        starts.append(j)
+    return starts[::-1]
+
+
 class LCD5Inch:
     """
     Driver for 5-inch LCD display.
@@ -31,6 +121,10 @@ class LCD5Inch:
 
     DEFAULT_WIDTH = 800
     DEFAULT_HEIGHT = 480
+    WRAP_CACHE_SIZE = 16  # Wrapped texts kept, so paging a story wraps it once
+    LAYOUT_CACHE_SIZE = 32  # Message layouts (font size + lines) kept
+    FB_PATH = "/dev/fb0"
+    FB_SYSFS = "/sys/class/graphics/fb0"
 
     def __init__(
         self,
@@ -57,30 +151,73 @@ class LCD5Inch:
         self._font_title: Optional["ImageFont"] = None
         self._font_body: Optional["ImageFont"] = None
         self._font_small: Optional["ImageFont"] = None
+        self._wrap_cache: "OrderedDict[Tuple[str, int], list[str]]" = OrderedDict()
+        self._layout_cache: "OrderedDict[tuple, Tuple[int, list[str]]]" = OrderedDict()
+        # Pagination of the story being shown: (title, text) -> (lines, lines per page)
+        self._story_cache: dict[Tuple[str, str], Tuple[list[str], int]] = {}
+
+        # Framebuffer mapped once; geometry read from sysfs at the same time
+        self._fb_fd: Optional[int] = None
+        self._fb_mmap: Optional[mmap.mmap] = None
+        self._fb_size: Tuple[int, int] = (width, height)
+        self._fb_depth = 32
+
+        # One canvas reused by every display method; the lock serializes
+        # callers on different threads (status updates, stories, messages)
+        self._canvas: Optional["Image.Image"] = None
+        self._draw: Optional["ImageDraw.ImageDraw"] = None
+        self._canvas_lock = threading.Lock()
 
         if PIL_AVAILABLE:
             self._load_fonts()
+            self._open_framebuffer()
+            self._canvas = Image.new("RGB", (width, height))
+            self._draw = ImageDraw.Draw(self._canvas)
 
         # Note: Actual hardware initialization would depend on the specific
         # display model being used. This is a framework that can be adapted.
         logger.info("LCD5Inch created (hardware init deferred)")
 
+    def _open_framebuffer(self) -> None:
+        """Map /dev/fb0 so each render is a single in-place copy."""
+        if not os.path.exists(self.FB_PATH):
+            return
+
+        try:
+            with open(f"{self.FB_SYSFS}/virtual_size", "r") as f:
+                fb_width, fb_height = (int(v) for v in f.read().strip().split(","))
+            with open(f"{self.FB_SYSFS}/bits_per_pixel", "r") as f:
+                fb_depth = int(f.read().strip())
+            fd = os.open(self.FB_PATH, os.O_RDWR)
+        except (OSError, ValueError) as e:
+            logger.warning(f"Could not open framebuffer: {e}")
+            return
+
+        try:
+            self._fb_mmap = mmap.mmap(fd, fb_width * fb_height * (fb_depth // 8))
+        except (OSError, ValueError) as e:
+            logger.warning(f"Could not map framebuffer: {e}")
+            os.close(fd)
+            return
+
+        self._fb_fd = fd
+        self._fb_size = (fb_width, fb_height)
+        self._fb_depth = fb_depth
+
+    def _begin_frame(self, background: Tuple[int, int, int]) -> "ImageDraw.ImageDraw":
+        """Reset the shared canvas to a background color; caller holds _canvas_lock."""
+        # A solid-color paste is a straight fill, ~3x cheaper than drawing a
+        # full-screen rectangle or decoding a prepared background with frombytes
+        self._canvas.paste(background, (0, 0, self.width, self.height))
+        return self._draw
+
     def _load_fonts(self) -> None:
         """Load fonts for different text sizes."""
-        try:
-            self._font_path = "/usr/share/fonts/truetype/dejavu/DejaVuSans-Bold.ttf"
-            # Check if bold exists, fall back to regular
-            import os
-            if not os.path.exists(self._font_path):
-                self._font_path = "/usr/share/fonts/truetype/dejavu/DejaVuSans.ttf"
-            self._font_title = ImageFont.truetype(self._font_path, 36)
-            self._font_body = ImageFont.truetype(self._font_path, 20)
-            self._font_small = ImageFont.truetype(self._font_path, 14)
-        except Exception:
-            self._font_path = None
-            self._font_title = ImageFont.load_default()
-            self._font_body = ImageFont.load_default()
-            self._font_small = ImageFont.load_default()
+        # Prefer bold, fall back to regular; shared with the other displays
+        self._font_path = font_path(bold=True)
+        self._font_title = get_font(36, bold=True)
+        self._font_body = get_font(20, bold=True)
+        self._font_small = get_font(14, bold=True)
 
     def _calculate_optimal_font_size(
         self,
@@ -103,52 +240,86 @@ class LCD5Inch:
         Returns:
             Tuple of (font_size, wrapped_lines)
         """
+        # The font path is part of the key: a fallback font changes the layout
+        key = (text, max_width, max_height, min_size, max_size, self._font_path)
+        cached = self._layout_cache.get(key)
+        if cached is not None:
+            self._layout_cache.move_to_end(key)
+            return cached
+
+        layout = self._search_font_size(text, max_width, max_height, min_size, max_size)
+        self._layout_cache[key] = layout
+        if len(self._layout_cache) > self.LAYOUT_CACHE_SIZE:
+            self._layout_cache.popitem(last=False)
+        return layout
+
+    def _search_font_size(
+        self,
+        text: str,
+        max_width: int,
+        max_height: int,
+        min_size: int,
+        max_size: int,
+    ) -> Tuple[int, list[str]]:
+        """Uncached search behind _calculate_optimal_font_size."""
         if not self._font_path:
             return (min_size, [text])
 
-        # Try font sizes from large to small
-        for size in range(max_size, min_size - 1, -4):
+        # Tokenize once for every candidate size; irregular spacing keeps textwrap
+        words = text.split()
+        plain = " ".join(words) == text
+
+        def wrap(width: int) -> list[str]:
+            wrapped = _pack_words(words, width) if plain else None
+            return wrapped if wrapped is not None else textwrap.wrap(text, width=width)
+
+        def fits(size: int) -> Optional[list[str]]:
+            """Wrapped lines if text fits at this size, else None."""
             try:
-                font = ImageFont.truetype(self._font_path, size)
+                font = get_font(size, bold=True)
 
                 # Calculate line height (approximately 1.2x font size)
                 line_height = int(size * 1.3)
 
                 # Calculate approximate characters per line
-                # Use a test character to get average width
-                test_bbox = font.getbbox("M")
-                avg_char_width = test_bbox[2] - test_bbox[0]
-                chars_per_line = max(1, int(max_width / avg_char_width))
+                # Use a test character's advance as the average width
+                chars_per_line = max(1, int(max_width / _advance(font, "M")))
 
                 # Wrap text
-                wrapped = textwrap.wrap(text, width=chars_per_line)
-
-                # Calculate total height needed
-                total_height = len(wrapped) * line_height
+                wrapped = wrap(chars_per_line)
 
-                # Check if it fits
-                if total_height <= max_height:
-                    # Verify width of each line
-                    fits = True
-                    for line in wrapped:
-                        bbox = font.getbbox(line)
-                        if (bbox[2] - bbox[0]) > max_width:
-                            fits = False
-                            break
-
-                    if fits:
-                        return (size, wrapped)
+                # Check the total height, then the width of each line
+                if len(wrapped) * line_height > max_height:
+                    return None
+                measure = font.getlength
+                for line in wrapped:
+                    if measure(line) > max_width:
+                        return None
+                return wrapped
 
             except Exception:
-                continue
+                return None
+
+        # Same candidate sizes as stepping down from max_size by 4, smallest
+        # first. Bigger fonts only fit less, so bisect for the largest fit.
+        sizes = list(range(max_size, min_size - 1, -4))[::-1]
+        best: Optional[Tuple[int, list[str]]] = None
+        lo, hi = 0, len(sizes) - 1
+        while lo <= hi:
+            mid = (lo + hi) // 2
+            wrapped = fits(sizes[mid])
+            if wrapped is not None:
+                best = (sizes[mid], wrapped)
+                lo = mid + 1
+            else:
+                hi = mid - 1
+        if best is not None:
+            return best
 
         # Fall back to minimum size
-        font = ImageFont.truetype(self._font_path, min_size)
-        test_bbox = font.getbbox("M")
-        avg_char_width = test_bbox[2] - test_bbox[0]
-        chars_per_line = max(1, int(max_width / avg_char_width))
-        wrapped = textwrap.wrap(text, width=chars_per_line)
-        return (min_size, wrapped)
+        font = get_font(min_size, bold=True)
+        chars_per_line = max(1, int(max_width / _advance(font, "M")))
+        return (min_size, wrap(chars_per_line))
 
     def display_status(
         self,
@@ -174,43 +345,44 @@ class LCD5Inch:
             return
 
         try:
-            # Create image
-            image = Image.new("RGB", (self.width, self.height), color=(20, 20, 30))
-            draw = ImageDraw.Draw(image)
-
-            # Title
-            draw.text((40, 30), title, font=self._font_title, fill=(100, 200, 255))
-
-            # Status
-            draw.text((40, 100), status, font=self._font_body, fill=(200, 200, 200))
-
-            # Progress bar
-            if progress > 0:
-                bar_y = 160
-                bar_width = int((self.width - 80) * progress)
-                draw.rectangle([40, bar_y, self.width - 40, bar_y + 20], outline=(100, 100, 100))
-                draw.rectangle([42, bar_y + 2, 42 + bar_width, bar_y + 18], fill=(100, 200, 100))
-                draw.text(
-                    (self.width - 80, bar_y + 2),
-                    f"{progress:.0%}",
-                    font=self._font_small,
-                    fill=(200, 200, 200),
-                )
+            bar_y = 160
+            bar_width = int((self.width - 80) * progress)
+
+            with self._canvas_lock:
+                draw = self._begin_frame((20, 20, 30))
+                if progress > 0:
+                    draw.rectangle([40, bar_y, self.width - 40, bar_y + 20], outline=(100, 100, 100))
+                    draw.rectangle([42, bar_y + 2, 42 + bar_width, bar_y + 18], fill=(100, 200, 100))
 
-            # Mood and energy (bottom section)
-            if mood or energy is not None:
-                bottom_y = self.height - 60
-                if mood:
-                    draw.text((40, bottom_y), f"Mood: {mood}", font=self._font_small, fill=(150, 150, 200))
-                if energy is not None:
+                # Title
+                draw.text((40, 30), title, font=self._font_title, fill=(100, 200, 255))
+
+                # Status
+                draw.text((40, 100), status, font=self._font_body, fill=(200, 200, 200))
+
+                # Progress percentage
+                if progress > 0:
                     draw.text(
-                        (self.width - 150, bottom_y),
-                        f"Energy: {energy:.0%}",
+                        (self.width - 80, bar_y + 2),
+                        f"{progress:.0%}",
                         font=self._font_small,
-                        fill=(150, 200, 150),
+                        fill=(200, 200, 200),
                     )
 
-            self._render_image(image, save_path=save_path)
+                # Mood and energy (bottom section)
+                if mood or energy is not None:
+                    bottom_y = self.height - 60
+                    if mood:
+                        draw.text((40, bottom_y), f"Mood: {mood}", font=self._font_small, fill=(150, 150, 200))
+                    if energy is not None:
+                        draw.text(
+                            (self.width - 150, bottom_y),
+                            f"Energy: {energy:.0%}",
+                            font=self._font_small,
+                            fill=(150, 200, 150),
+                        )
+
+                self._render_image(self._canvas, save_path=save_path)
 
         except Exception as e:
             logger.error(f"Failed to display status: {e}")
@@ -229,52 +401,57 @@ class LCD5Inch:
             return
 
         try:
-            # Create image with warm bedtime colors
-            image = Image.new("RGB", (self.width, self.height), color=(25, 20, 35))
-            draw = ImageDraw.Draw(image)
-
-            # Title (centered, with decorative line)
-            title_bbox = draw.textbbox((0, 0), title, font=self._font_title)
-            title_width = title_bbox[2] - title_bbox[0]
-            title_x = (self.width - title_width) // 2
-            draw.text((title_x, 30), title, font=self._font_title, fill=(255, 220, 150))
-
-            # Decorative line under title
-            line_y = 80
-            draw.line([(40, line_y), (self.width - 40, line_y)], fill=(100, 80, 60), width=2)
-
-            # Story text (word-wrapped)
-            margin = 50
-            text_width = self.width - (margin * 2)
-            wrapped_lines = self._wrap_text(text, text_width)
-
-            # Calculate how many lines fit per page
-            line_height = 28
-            max_lines = (self.height - 150) // line_height
-
-            # Get lines for this page
-            start_idx = (page - 1) * max_lines
-            end_idx = start_idx + max_lines
-            page_lines = wrapped_lines[start_idx:end_idx]
-
-            # Draw text
-            y = 100
-            for line in page_lines:
-                draw.text((margin, y), line, font=self._font_body, fill=(220, 220, 230))
-                y += line_height
-
-            # Page indicator if multi-page
-            total_pages = (len(wrapped_lines) + max_lines - 1) // max_lines
-            if total_pages > 1:
-                page_text = f"Page {page} of {total_pages}"
-                draw.text(
-                    (self.width // 2 - 40, self.height - 40),
-                    page_text,
-                    font=self._font_small,
-                    fill=(150, 150, 170),
-                )
+            with self._canvas_lock:
+                # Warm bedtime colors
+                draw = self._begin_frame((25, 20, 35))
+
+                # Title (centered, with decorative line)
+                title_bbox = _measure(self._font_title, title)
+                title_width = title_bbox[2] - title_bbox[0]
+                title_x = (self.width - title_width) // 2
+                draw.text((title_x, 30), title, font=self._font_title, fill=(255, 220, 150))
+
+                # Decorative line under title
+                line_y = 80
+                draw.line([(40, line_y), (self.width - 40, line_y)], fill=(100, 80, 60), width=2)
+
+                # Story text (word-wrapped once per story, then only sliced per page)
+                margin = 50
+                line_height = 28
+                story_key = (title, text)
+                cached = self._story_cache.get(story_key)
+                if cached is None:
+                    text_width = self.width - (margin * 2)
+                    # Calculate how many lines fit per page
+                    cached = (self._wrap_text(text, text_width), (self.height - 150) // line_height)
+                    self._story_cache.clear()
+                    self._story_cache[story_key] = cached
+                wrapped_lines, max_lines = cached
+
+                # Get lines for this page
+                start_idx = (page - 1) * max_lines
+                end_idx = start_idx + max_lines
+                page_lines = wrapped_lines[start_idx:end_idx]
+
+                # Draw text (one call per line: multiline_text draws each line
+                # the same way and measures every line first, so it's slower)
+                y = 100
+                for line in page_lines:
+                    draw.text((margin, y), line, font=self._font_body, fill=(220, 220, 230))
+                    y += line_height
+
+                # Page indicator if multi-page
+                total_pages = (len(wrapped_lines) + max_lines - 1) // max_lines
+                if total_pages > 1:
+                    page_text = f"Page {page} of {total_pages}"
+                    draw.text(
+                        (self.width // 2 - 40, self.height - 40),
+                        page_text,
+                        font=self._font_small,
+                        fill=(150, 150, 170),
+                    )
 
-            self._render_image(image, save_path=save_path)
+                self._render_image(self._canvas, save_path=save_path)
 
         except Exception as e:
             logger.error(f"Failed to display story: {e}")
@@ -303,56 +480,56 @@ class LCD5Inch:
             return
 
         try:
-            image = Image.new("RGB", (self.width, self.height), color=(20, 20, 30))
-            draw = ImageDraw.Draw(image)
-
-            # Calculate available space
-            margin = 40
-            content_width = self.width - (margin * 2)
-
-            # Reserve space for title if present
-            title_height = 0
-            if title:
-                title_font = ImageFont.truetype(self._font_path, 28) if self._font_path else self._font_title
-                draw.text((margin, 20), title, font=title_font, fill=(100, 200, 255))
-                title_height = 70  # Title + padding
-
-            # Available height for message
-            content_height = self.height - title_height - (margin * 2)
-            content_top = title_height + margin
-
-            # Calculate optimal font size for the message
-            font_size, wrapped_lines = self._calculate_optimal_font_size(
-                message,
-                max_width=content_width,
-                max_height=content_height,
-                min_size=24,
-                max_size=140,  # Allow really big fonts for short messages
-            )
-
-            # Load the calculated font
-            if self._font_path:
-                message_font = ImageFont.truetype(self._font_path, font_size)
-            else:
-                message_font = self._font_body
+            with self._canvas_lock:
+                draw = self._begin_frame((20, 20, 30))
+
+                # Calculate available space
+                margin = 40
+                content_width = self.width - (margin * 2)
+
+                # Reserve space for title if present
+                title_height = 0
+                if title:
+                    title_font = get_font(28, bold=True) if self._font_path else self._font_title
+                    draw.text((margin, 20), title, font=title_font, fill=(100, 200, 255))
+                    title_height = 70  # Title + padding
+
+                # Available height for message
+                content_height = self.height - title_height - (margin * 2)
+                content_top = title_height + margin
+
+                # Calculate optimal font size for the message
+                font_size, wrapped_lines = self._calculate_optimal_font_size(
+                    message,
+                    max_width=content_width,
+                    max_height=content_height,
+                    min_size=24,
+                    max_size=140,  # Allow really big fonts for short messages
+                )
+
+                # Load the calculated font
+                if self._font_path:
+                    message_font = get_font(font_size, bold=True)
+                else:
+                    message_font = self._font_body
 
-            # Calculate line height
-            line_height = int(font_size * 1.3)
+                # Calculate line height
+                line_height = int(font_size * 1.3)
 
-            # Calculate total text height and center vertically
-            total_text_height = len(wrapped_lines) * line_height
-            start_y = content_top + (content_height - total_text_height) // 2
+                # Calculate total text height and center vertically
+                total_text_height = len(wrapped_lines) * line_height
+                start_y = content_top + (content_height - total_text_height) // 2
 
-            # Draw each line, centered horizontally
-            for i, line in enumerate(wrapped_lines):
-                bbox = message_font.getbbox(line)
-                line_width = bbox[2] - bbox[0]
-                x = (self.width - line_width) // 2  # Center horizontally
-                y = start_y + (i * line_height)
-                draw.text((x, y), line, font=message_font, fill=color)
+                # Draw each line, centered horizontally
+                for i, line in enumerate(wrapped_lines):
+                    bbox = message_font.getbbox(line)
+                    line_width = bbox[2] - bbox[0]
+                    x = (self.width - line_width) // 2  # Center horizontally
+                    y = start_y + (i * line_height)
+                    draw.text((x, y), line, font=message_font, fill=color)
 
-            logger.debug(f"Displaying message with font size {font_size}px, {len(wrapped_lines)} lines")
-            self._render_image(image, save_path=save_path)
+                logger.debug(f"Displaying message with font size {font_size}px, {len(wrapped_lines)} lines")
+                self._render_image(self._canvas, save_path=save_path)
 
         except Exception as e:
             logger.error(f"Failed to display message: {e}")
@@ -366,74 +543,129 @@ class LCD5Inch:
             return
 
         try:
-            # Dark background
-            image = Image.new("RGB", (self.width, self.height), color=(15, 15, 25))
-            draw = ImageDraw.Draw(image)
-
-            # Rainbow colors for the banner
-            rainbow = [
-                (255, 0, 0),      # Red
-                (255, 127, 0),    # Orange
-                (255, 255, 0),    # Yellow
-                (0, 255, 0),      # Green
-                (0, 127, 255),    # Blue
-                (75, 0, 130),     # Indigo
-                (148, 0, 211),    # Violet
-            ]
-
-            # Large font for BRAINBOT
-            if self._font_path:
-                banner_font = ImageFont.truetype(self._font_path, 90)
-                small_font = ImageFont.truetype(self._font_path, 36)
-            else:
-                banner_font = self._font_title
-                small_font = self._font_body
-
-            # Draw BRAINBOT with each letter in rainbow
-            text = "BRAINBOT"
-            # Calculate total width to center
-            total_width = sum(banner_font.getbbox(c)[2] - banner_font.getbbox(c)[0] for c in text)
-            total_width += (len(text) - 1) * 5  # spacing
-
-            x = (self.width - total_width) // 2
-            y = self.height // 2 - 60
-
-            for i, char in enumerate(text):
-                color = rainbow[i % len(rainbow)]
-                draw.text((x, y), char, font=banner_font, fill=color)
-                bbox = banner_font.getbbox(char)
-                x += (bbox[2] - bbox[0]) + 5  # char width + spacing
-
-            # Subtitle
-            subtitle = "Autonomous AI Agent"
-            sub_bbox = small_font.getbbox(subtitle)
-            sub_width = sub_bbox[2] - sub_bbox[0]
-            sub_x = (self.width - sub_width) // 2
-            draw.text((sub_x, y + 110), subtitle, font=small_font, fill=(150, 150, 180))
-
-            # Decorative lines
-            line_y = y + 95
-            draw.line([(50, line_y), (self.width // 2 - 100, line_y)], fill=(60, 60, 80), width=2)
-            draw.line([(self.width // 2 + 100, line_y), (self.width - 50, line_y)], fill=(60, 60, 80), width=2)
-
-            self._render_image(image, save_path=save_path)
+            with self._canvas_lock:
+                # Dark background
+                draw = self._begin_frame((15, 15, 25))
+
+                # Rainbow colors for the banner
+                rainbow = [
+                    (255, 0, 0),      # Red
+                    (255, 127, 0),    # Orange
+                    (255, 255, 0),    # Yellow
+                    (0, 255, 0),      # Green
+                    (0, 127, 255),    # Blue
+                    (75, 0, 130),     # Indigo
+                    (148, 0, 211),    # Violet
+                ]
+
+                # Large font for BRAINBOT
+                if self._font_path:
+                    banner_font = get_font(90, bold=True)
+                    small_font = get_font(36, bold=True)
+                else:
+                    banner_font = self._font_title
+                    small_font = self._font_body
+
+                # Draw BRAINBOT with each letter in rainbow
+                text = "BRAINBOT"
+                # Calculate total width to center
+                total_width = sum(banner_font.getbbox(c)[2] - banner_font.getbbox(c)[0] for c in text)
+                total_width += (len(text) - 1) * 5  # spacing
+
+                x = (self.width - total_width) // 2
+                y = self.height // 2 - 60
+
+                for i, char in enumerate(text):
+                    color = rainbow[i % len(rainbow)]
+                    draw.text((x, y), char, font=banner_font, fill=color)
+                    bbox = banner_font.getbbox(char)
+                    x += (bbox[2] - bbox[0]) + 5  # char width + spacing
+
+                # Subtitle
+                subtitle = "Autonomous AI Agent"
+                sub_bbox = small_font.getbbox(subtitle)
+                sub_width = sub_bbox[2] - sub_bbox[0]
+                sub_x = (self.width - sub_width) // 2
+                draw.text((sub_x, y + 110), subtitle, font=small_font, fill=(150, 150, 180))
+
+                # Decorative lines
+                line_y = y + 95
+                draw.line([(50, line_y), (self.width // 2 - 100, line_y)], fill=(60, 60, 80), width=2)
+                draw.line([(self.width // 2 + 100, line_y), (self.width - 50, line_y)], fill=(60, 60, 80), width=2)
+
+                self._render_image(self._canvas, save_path=save_path)
 
         except Exception as e:
             logger.error(f"Failed to display banner: {e}")
 
     def clear(self) -> None:
         """Clear the display."""
+        self._story_cache.clear()
         if PIL_AVAILABLE:
-            image = Image.new("RGB", (self.width, self.height), color=(0, 0, 0))
-            self._render_image(image)
+            with self._canvas_lock:
+                self._begin_frame((0, 0, 0))
+                self._render_image(self._canvas)
         logger.debug("LCD5Inch cleared")
 
     def _wrap_text(self, text: str, max_width: int) -> list[str]:
-        """Wrap text to fit within width."""
-        # Approximate characters per line based on font
-        chars_per_line = max_width // 10  # Rough estimate
-        wrapped = textwrap.wrap(text, width=chars_per_line)
-        return wrapped
+        """Wrap text to fit within width, measured with the body font."""
+        key = (text, max_width)
+        cached = self._wrap_cache.get(key)
+        if cached is not None:
+            self._wrap_cache.move_to_end(key)
+            return cached
+
+        measure = self._font_body.getlength
+        space = measure(" ")
+        widths: dict[str, float] = {}
+        lines = []
+        # Runs of words between forced breaks, each with its word widths
+        runs: list[Tuple[list[str], list[float]]] = [([], [])]
+
+        for word in text.split():
+            width = widths.get(word)
+            if width is None:
+                width = widths[word] = measure(word)
+
+            # A single word wider than the line: split it where it stops fitting
+            while width > max_width:
+                lo, hi = 1, len(word) - 1
+                while lo < hi:
+                    mid = (lo + hi + 1) // 2
+                    if measure(word[:mid]) <= max_width:
+                        lo = mid
+                    else:
+                        hi = mid - 1
+                runs.append(([word[:lo]], [measure(word[:lo])]))
+                runs.append(([], []))
+                word = word[lo:]
+                width = measure(word)
+
+            runs[-1][0].append(word)
+            runs[-1][1].append(width)
+
+        for words, word_widths in runs:
+            if not words:
+                continue
+            starts = _break_lines(word_widths, space, max_width)
+            for start, end in zip(starts, starts[1:] + [len(words)]):
+                line = words[start:end]
+                # Summed word widths ignore kerning; confirm nearly full lines
+                # against the real width and push overflow onto its own line
+                line_width = sum(word_widths[start:end]) + space * (end - start - 1)
+                while len(line) > 1 and line_width > max_width - space and measure(" ".join(line)) > max_width:
+                    fit = len(line) - 1
+                    while fit > 1 and measure(" ".join(line[:fit])) > max_width:
+                        fit -= 1
+                    lines.append(" ".join(line[:fit]))
+                    line = line[fit:]
+                    line_width = measure(" ".join(line))
+                lines.append(" ".join(line))
+
+        self._wrap_cache[key] = lines
+        if len(self._wrap_cache) > self.WRAP_CACHE_SIZE:
+            self._wrap_cache.popitem(last=False)
+        return lines
 
     def _render_image(self, image: "Image", save_path: Optional[str] = None) -> None:
         """
@@ -443,42 +675,56 @@ class LCD5Inch:
             image: PIL Image to display
             save_path: If provided, save image to this path (for desktop mode)
         """
-        # Save to file if path provided (for feh display)
+        # Save to file if path provided (for feh display). The caller shows it
+        # right away, so the write stays synchronous; fastest zlib level keeps
+        # the encode ~3x cheaper for a slightly larger file.
         if save_path:
             try:
-                image.save(save_path, "PNG")
+                image.save(save_path, "PNG", compress_level=1)
                 logger.debug(f"Image saved to {save_path}")
             except Exception as e:
                 logger.error(f"Failed to save image: {e}")
 
         # Try to render to framebuffer
         try:
-            import os
-            fb_path = "/dev/fb0"
-            if os.path.exists(fb_path):
+            if self._fb_mmap is not None:
                 # Convert to RGB and resize to framebuffer size if needed
-                rgb_image = image.convert("RGB")
-
-                # Get framebuffer info
-                with open("/sys/class/graphics/fb0/virtual_size", "r") as f:
-                    fb_size = f.read().strip().split(",")
-                    fb_width, fb_height = int(fb_size[0]), int(fb_size[1])
-
-                # Resize image to fit framebuffer
-                if rgb_image.size != (fb_width, fb_height):
-                    rgb_image = rgb_image.resize((fb_width, fb_height), Image.LANCZOS)
-
-                # Convert to BGRA for framebuffer (32-bit)
-                rgba_image = rgb_image.convert("RGBA")
-                # Swap R and B channels for BGR format
-                r, g, b, a = rgba_image.split()
-                bgra_image = Image.merge("RGBA", (b, g, r, a))
+                # (convert always copies, so skip it for the RGB canvas)
+                rgb_image = image if image.mode == "RGB" else image.convert("RGB")
+
+                # Resize image to fit framebuffer: pixel replication or box
+                # reduction for whole-number scales, BILINEAR otherwise
+                if rgb_image.size != self._fb_size:
+                    (width, height), (fb_width, fb_height) = rgb_image.size, self._fb_size
+                    if fb_width % width == 0 and fb_width // width == fb_height / height:
+                        rgb_image = rgb_image.resize(self._fb_size, Image.NEAREST)
+                    elif width % fb_width == 0 and width // fb_width == height / fb_height:
+                        rgb_image = rgb_image.reduce(width // fb_width)
+                    else:
+                        rgb_image = rgb_image.resize(self._fb_size, Image.BILINEAR)
+
+                if self._fb_depth == 16 and NUMPY_AVAILABLE:
+                    # RGB565 framebuffer: half the bytes of 32-bit BGRA
+                    pb = np.asarray(rgb_image, dtype=np.uint16)
+                    color = ((pb[..., 0] & 0xF8) << 8) | ((pb[..., 1] & 0xFC) << 3) | (pb[..., 2] >> 3)
+                    fb_bytes = color.astype("<u2").tobytes()
+                elif NUMPY_AVAILABLE:
+                    # BGRA for framebuffer (32-bit): one channel swap, no band copies
+                    rgb = np.asarray(rgb_image, dtype=np.uint8)
+                    bgra = np.empty((rgb.shape[0], rgb.shape[1], 4), dtype=np.uint8)
+                    bgra[..., 0] = rgb[..., 2]
+                    bgra[..., 1] = rgb[..., 1]
+                    bgra[..., 2] = rgb[..., 0]
+                    bgra[..., 3] = 255
+                    fb_bytes = bgra.tobytes()
+                else:
+                    # PIL's raw encoder reorders channels in one pass
+                    fb_bytes = rgb_image.convert("RGBA").tobytes("raw", "BGRA")
 
                 # Write to framebuffer
-                with open(fb_path, "wb") as fb:
-                    fb.write(bgra_image.tobytes())
+                self._fb_mmap[:len(fb_bytes)] = fb_bytes
 
-                logger.info("LCD5Inch rendered to framebuffer")
+                logger.debug("LCD5Inch rendered to framebuffer")
         except Exception as e:
             logger.warning(f"Could not render to framebuffer: {e}")
 
@@ -1,9 +1,12 @@
 """LED/NeoPixel controller for mood lighting."""
 
+import functools
 import logging
+import math
+import random
 import time
 import threading
-from typing import Optional, Tuple
+from typing import Optional, Sequence, Tuple
 from enum import Enum
 
 logger = logging.getLogger(__name__)
@@ -16,6 +19,12 @@ try:
 except ImportError:
     NEOPIXEL_AVAILABLE = False
 
+try:
+    import numpy as np
+    NUMPY_AVAILABLE = True
+except ImportError:
+    NUMPY_AVAILABLE = False
+
 
 class LEDPattern(str, Enum):
     """Available LED patterns."""
@@ -45,6 +54,42 @@ COLORS = {
 }
 
 
+def _compute_wheel(pos: int) -> Tuple[int, int, int]:
+    """Generate rainbow colors across 0-255 positions."""
+    if pos < 85:
+        return (pos * 3, 255 - pos * 3, 0)
+    elif pos < 170:
+        pos -= 85
+        return (255 - pos * 3, 0, pos * 3)
+    else:
+        pos -= 170
+        return (0, pos * 3, 255 - pos * 3)
+
+
+# Rainbow color wheel, indexed by position (0-255)
+_WHEEL = [_compute_wheel(p) for p in range(256)]
+_WHEEL_ARRAY = np.array(_WHEEL, dtype=np.uint8) if NUMPY_AVAILABLE else None
+
+
+@functools.lru_cache(maxsize=64)
+def _parse_hex_color(color: str) -> Optional[Tuple[int, int, int]]:
+    """Parse "#rrggbb" or "rrggbb" once per distinct string; None if invalid."""
+    try:
+        if color.startswith("#"):
+            color = color[1:]
+        return tuple(int(color[i:i+2], 16) for i in (0, 2, 4))
+    except Exception:
+        return None
+
+
+@functools.lru_cache(maxsize=16)
+def _brightness_lut(color: Tuple[int, int, int]) -> Tuple[Tuple[int, int, int], ...]:
+    """Dimmed copies of a color for each 8-bit brightness level (0-255)."""
+    return tuple(
+        tuple((c * level) // 255 for c in color) for level in range(256)
+    )
+
+
 class LEDController:
     """
     Controller for NeoPixel LED strip.
@@ -73,6 +118,10 @@ class LEDController:
         self.pin = pin
         self.num_pixels = num_pixels
         self.brightness = brightness
+        # Wheel offset of each pixel so the rainbow spans the whole strip
+        self._wheel_offsets = [i * 256 // num_pixels for i in range(num_pixels)]
+        if NUMPY_AVAILABLE:
+            self._wheel_offsets = np.array(self._wheel_offsets, dtype=np.intp)
 
         self._pixels: Optional["neopixel.NeoPixel"] = None
         self._animation_thread: Optional[threading.Thread] = None
@@ -80,6 +129,14 @@ class LEDController:
         self._current_pattern = LEDPattern.SOLID
         self._current_color = COLORS["white"]
         self._current_speed = 1.0
+        self._frame_deadline = 0.0
+        # Color last written by _set_all_pixels (None once anything else writes)
+        self._last_color: Optional[Tuple[int, int, int]] = None
+        self._bright_lut = _brightness_lut(self._current_color)
+        # numpy views of the strip's byte buffers (see _share_buffer) and a
+        # scratch frame the animations draw into
+        self._buffer_view: Optional[tuple] = None
+        self._frame_buf = np.zeros((num_pixels, 3), dtype=np.uint8) if NUMPY_AVAILABLE else None
 
         if NEOPIXEL_AVAILABLE:
             self._initialize()
@@ -101,6 +158,7 @@ class LEDController:
                 brightness=self.brightness,
                 auto_write=False,
             )
+            self._share_buffer()
             logger.info(f"LED controller initialized with {self.num_pixels} pixels")
             return True
 
@@ -126,6 +184,7 @@ class LEDController:
         self._stop_animation.set()
         if self._animation_thread and self._animation_thread.is_alive():
             self._animation_thread.join(timeout=1.0)
+        self._last_color = None
 
         # Parse color
         if color == "rainbow":
@@ -134,13 +193,9 @@ class LEDController:
             self._current_color = COLORS[color]
         else:
             # Try to parse hex color
-            try:
-                if color.startswith("#"):
-                    color = color[1:]
-                self._current_color = tuple(int(color[i:i+2], 16) for i in (0, 2, 4))
-            except Exception:
-                self._current_color = COLORS["white"]
+            self._current_color = _parse_hex_color(color) or COLORS["white"]
 
+        self._bright_lut = _brightness_lut(self._current_color or COLORS["white"])
         self._current_speed = max(0.1, min(5.0, speed))
         self._current_pattern = LEDPattern(pattern.lower()) if pattern.lower() in [p.value for p in LEDPattern] else LEDPattern.SOLID
 
@@ -160,6 +215,7 @@ class LEDController:
 
     def _run_animation(self) -> None:
         """Run the current animation pattern."""
+        self._frame_deadline = time.monotonic()
         while not self._stop_animation.is_set():
             try:
                 if self._current_pattern == LEDPattern.BREATHE:
@@ -178,137 +234,218 @@ class LEDController:
 
     def _animate_breathe(self) -> None:
         """Smooth breathing animation."""
-        import math
-        color = self._current_color or COLORS["white"]
+        lut = self._bright_lut
         step = 0
 
         while not self._stop_animation.is_set():
             # Sine wave for smooth breathing
-            brightness = (math.sin(step * 0.1 * self._current_speed) + 1) / 2
-            brightness = max(0.1, brightness)  # Keep minimum brightness
+            level = int((math.sin(step * 0.1 * self._current_speed) + 1) * 127.5)
+            level = max(25, level)  # Keep minimum brightness (~0.1)
 
-            dimmed = tuple(int(c * brightness) for c in color)
-            self._set_all_pixels(dimmed)
+            self._set_all_pixels(lut[level])
 
             step += 1
-            time.sleep(0.05)
+            if self._wait_frame(0.05):
+                return
 
     def _animate_pulse(self) -> None:
         """Quick pulsing animation."""
-        color = self._current_color or COLORS["white"]
+        lut = self._bright_lut
+        # Brightness levels for the 10-step fade (0.0-0.9, then 1.0-0.1)
+        fade_up = [lut[i * 255 // 10] for i in range(10)]
+        fade_down = [lut[i * 255 // 10] for i in range(10, 0, -1)]
 
         while not self._stop_animation.is_set():
             # Fade up
-            for i in range(10):
-                brightness = i / 10
-                dimmed = tuple(int(c * brightness) for c in color)
+            for dimmed in fade_up:
                 self._set_all_pixels(dimmed)
-                time.sleep(0.02 / self._current_speed)
+                if self._wait_frame(0.02 / self._current_speed):
+                    return
 
             # Hold
-            self._set_all_pixels(color)
-            time.sleep(0.1 / self._current_speed)
+            self._set_all_pixels(lut[255])
+            if self._wait_frame(0.1 / self._current_speed):
+                return
 
             # Fade down
-            for i in range(10, 0, -1):
-                brightness = i / 10
-                dimmed = tuple(int(c * brightness) for c in color)
+            for dimmed in fade_down:
                 self._set_all_pixels(dimmed)
-                time.sleep(0.02 / self._current_speed)
+                if self._wait_frame(0.02 / self._current_speed):
+                    return
 
-            time.sleep(0.1 / self._current_speed)
+            if self._wait_frame(0.1 / self._current_speed):
+                return
 
     def _animate_rainbow(self) -> None:
         """Rainbow color cycle."""
         step = 0
 
         while not self._stop_animation.is_set():
-            for i in range(self.num_pixels):
-                pixel_index = (i * 256 // self.num_pixels + step) % 256
-                self._set_pixel(i, self._wheel(pixel_index))
-
-            self._show()
+            if NUMPY_AVAILABLE:
+                # Whole strip in one table lookup, into the scratch frame
+                frame = np.take(
+                    _WHEEL_ARRAY, (self._wheel_offsets + step) & 0xFF, axis=0, out=self._frame_buf
+                )
+            else:
+                frame = [_WHEEL[(offset + step) & 0xFF] for offset in self._wheel_offsets]
+            self._write_frame(frame)
             step = (step + int(2 * self._current_speed)) % 256
-            time.sleep(0.02)
+            if self._wait_frame(0.02):
+                return
 
     def _animate_chase(self) -> None:
         """Chasing light animation."""
-        color = self._current_color or COLORS["white"]
+        lut = self._bright_lut
+        # Head at full brightness, tail at 0.7 and 0.4
+        trail = [lut[int((1.0 - offset * 0.3) * 255)] for offset in range(3)]
         position = 0
 
         while not self._stop_animation.is_set():
-            self._clear_pixels()
+            frame = self._new_frame()
 
             # Light up 2-3 consecutive pixels
-            for offset in range(3):
-                idx = (position + offset) % self.num_pixels
-                brightness = 1.0 - (offset * 0.3)
-                dimmed = tuple(int(c * brightness) for c in color)
-                self._set_pixel(idx, dimmed)
+            for offset, dimmed in enumerate(trail):
+                frame[(position + offset) % self.num_pixels] = dimmed
 
-            self._show()
+            self._write_frame(frame)
             position = (position + 1) % self.num_pixels
-            time.sleep(0.1 / self._current_speed)
+            if self._wait_frame(0.1 / self._current_speed):
+                return
 
     def _animate_sparkle(self) -> None:
         """Random sparkle effect."""
-        import random
-        color = self._current_color or COLORS["white"]
+        lut = self._bright_lut
 
         while not self._stop_animation.is_set():
-            self._clear_pixels()
+            frame = self._new_frame()
 
-            # Random sparkles
+            # Random sparkles (brightness 0.5-1.0)
             num_sparkles = max(1, self.num_pixels // 3)
             for _ in range(num_sparkles):
                 idx = random.randint(0, self.num_pixels - 1)
-                brightness = random.uniform(0.5, 1.0)
-                dimmed = tuple(int(c * brightness) for c in color)
-                self._set_pixel(idx, dimmed)
-
-            self._show()
-            time.sleep(0.05 / self._current_speed)
-
-    def _wheel(self, pos: int) -> Tuple[int, int, int]:
-        """Generate rainbow colors across 0-255 positions."""
-        if pos < 85:
-            return (pos * 3, 255 - pos * 3, 0)
-        elif pos < 170:
-            pos -= 85
-            return (255 - pos * 3, 0, pos * 3)
-        else:
-            pos -= 170
-            return (0, pos * 3, 255 - pos * 3)
+                frame[idx] = lut[random.randint(128, 255)]
+
+            self._write_frame(frame)
+            if self._wait_frame(0.05 / self._current_speed):
+                return
+
+    def _wait_frame(self, period: float) -> bool:
+        """
+        Wait out one frame period, paced on the monotonic clock.
+
+        Frames are scheduled at fixed deadlines so drawing time doesn't add
+        drift; a late frame resynchronizes instead of bursting to catch up.
+
+        Args:
+            period: Frame period in seconds
+
+        Returns:
+            True if the animation was stopped while waiting
+        """
+        now = time.monotonic()
+        self._frame_deadline = max(self._frame_deadline + period, now)
+        return self._stop_animation.wait(self._frame_deadline - now)
 
     def _set_all_pixels(self, color: Tuple[int, int, int]) -> None:
-        """Set all pixels to same color."""
-        if self._pixels:
+        """Set all pixels to same color; a repeat of the last color is skipped."""
+        if color == self._last_color:
+            return
+        self._last_color = color
+        if self._buffer_view is not None:
+            self._frame_buf[:] = color
+            self._commit(self._frame_buf)
+        elif self._pixels:
             self._pixels.fill(color)
             self._pixels.show()
         else:
             logger.debug(f"LED (sim): all pixels -> {color}")
 
-    def _set_pixel(self, index: int, color: Tuple[int, int, int]) -> None:
-        """Set a single pixel."""
-        if self._pixels and 0 <= index < self.num_pixels:
-            self._pixels[index] = color
+    def _new_frame(self) -> Sequence[Sequence[int]]:
+        """Blank frame to draw into: the shared numpy scratch when mapped."""
+        if self._buffer_view is not None:
+            self._frame_buf.fill(0)
+            return self._frame_buf
+        return [(0, 0, 0)] * self.num_pixels
 
-    def _clear_pixels(self) -> None:
-        """Clear all pixels (set to black)."""
-        if self._pixels:
-            self._pixels.fill((0, 0, 0))
+    def _write_frame(self, frame: Sequence[Sequence[int]]) -> None:
+        """Write a full frame (one color per pixel) and update the strip.
 
-    def _show(self) -> None:
-        """Update the LED strip."""
+        The whole strip is assigned as one slice so the pixel buffer is
+        filled in a single call instead of one __setitem__ per pixel; numpy
+        frames go straight into the strip's byte buffer via _commit.
+        """
+        self._last_color = None
         if self._pixels:
+            if NUMPY_AVAILABLE and isinstance(frame, np.ndarray):
+                if self._commit(frame):
+                    return
+                frame = frame.tolist()
+            self._pixels[:] = frame
             self._pixels.show()
 
+    def _share_buffer(self) -> None:
+        """
+        Map the NeoPixel byte buffers as numpy arrays for zero-copy frames.
+
+        Only plain 3-byte-per-pixel pixelbuf strips are mapped; anything
+        else (RGBW, DotStar, other drivers) keeps the slice-setter path.
+        """
+        self._buffer_view = None
+        if not (NUMPY_AVAILABLE and self._pixels):
+            return
+
+        pixels = self._pixels
+        try:
+            if pixels._bpp != 3 or pixels._dotstar_mode:
+                return
+            order = list(pixels._byteorder[:3])
+
+            def view(buf: Optional[bytearray]) -> Optional["np.ndarray"]:
+                if buf is None:
+                    return None
+                return np.frombuffer(
+                    buf, dtype=np.uint8, count=self.num_pixels * 3, offset=pixels._offset
+                ).reshape(self.num_pixels, 3)
+
+            self._buffer_view = (
+                view(pixels._post_brightness_buffer),
+                view(pixels._pre_brightness_buffer),
+                order,
+            )
+        except (AttributeError, TypeError, ValueError) as e:
+            logger.debug(f"NeoPixel buffer not shared: {e}")
+
+    def _commit(self, frame: "np.ndarray") -> bool:
+        """
+        Copy an RGB frame into the mapped NeoPixel buffer and show it.
+
+        Applies the strip's channel order and brightness the same way the
+        pixelbuf setters do, without parsing each color in Python.
+
+        Args:
+            frame: (num_pixels, 3) uint8 array of RGB colors
+
+        Returns:
+            False if the strip's buffer isn't mapped
+        """
+        if self._buffer_view is None:
+            return False
+
+        post, pre, order = self._buffer_view
+        brightness = self._pixels._brightness
+        if pre is not None:
+            pre[:, order] = frame
+        post[:, order] = frame if brightness == 1.0 else frame * brightness
+        self._pixels.show()
+        return True
+
     def off(self) -> None:
         """Turn off all LEDs."""
         self._stop_animation.set()
         if self._animation_thread and self._animation_thread.is_alive():
             self._animation_thread.join(timeout=1.0)
 
+        self._last_color = None
         self._set_all_pixels((0, 0, 0))
         logger.debug("LEDs turned off")
 
@@ -317,6 +454,8 @@ class LEDController:
         self.brightness = max(0.0, min(1.0, brightness))
         if self._pixels:
             self._pixels.brightness = self.brightness
+            # Leaving full brightness allocates pixelbuf's unscaled buffer
+            self._share_buffer()
             self._pixels.show()
 
     def is_available(self) -> bool:
@@ -1,54 +1,170 @@
 """BrainBot Hardware MCP Server using FastMCP."""
 
-import json
+import functools
+import importlib
+import importlib.util
+import inspect
 import logging
 import sys
-from typing import Optional
+import threading
+import time
+from typing import IO, Callable, Literal, Optional, Tuple, Union
 
 from fastmcp import FastMCP
 
-# Import hardware controllers (with graceful fallback)
 try:
-    from .lcd_1inch import LCD1Inch
-    LCD_1INCH_AVAILABLE = True
-except ImportError:
-    LCD_1INCH_AVAILABLE = False
+    from fastmcp.tools import ToolResult
+except ImportError:  # fastmcp 2.x only exposes it from the tool module
+    from fastmcp.tools.tool import ToolResult
 
-try:
-    from .lcd_5inch import LCD5Inch
-    LCD_5INCH_AVAILABLE = True
-except ImportError:
-    LCD_5INCH_AVAILABLE = False
+logger = logging.getLogger(__name__)
 
-try:
-    from .led_controller import LEDController
-    LED_AVAILABLE = True
-except ImportError:
-    LED_AVAILABLE = False
 
-try:
-    from .fan_controller import FanController
-    FAN_AVAILABLE = True
-except ImportError:
-    FAN_AVAILABLE = False
+# Hardware controllers are imported on first use, so starting the server
+# doesn't pay for PIL/numpy/luma/GPIO imports of devices it never touches.
+# Availability starts out as "the module can be found" and is cleared by
+# _load if importing it then fails.
+def _module_available(module: str) -> bool:
+    """Whether a hardware module exists, without importing it."""
+    return importlib.util.find_spec(f"{__package__}.{module}") is not None
+
+
+LCD_1INCH_AVAILABLE = _module_available("lcd_1inch")
+LCD_5INCH_AVAILABLE = _module_available("lcd_5inch")
+LED_AVAILABLE = _module_available("led_controller")
+FAN_AVAILABLE = _module_available("fan_controller")
+
+_LAZY_IMPORTS = {
+    "LCD1Inch": "lcd_1inch",
+    "create_lcd_1inch": "lcd_1inch",
+    "LCD5Inch": "lcd_5inch",
+    "LEDController": "led_controller",
+    "FanController": "fan_controller",
+}
+
+# Whole modules imported the same way; psutil is only needed by the
+# system health tool
+_LAZY_MODULES = {"psutil"}
+
+
+def __getattr__(name: str):
+    """Import hardware controller names and lazy modules on first access (PEP 562)."""
+    if name in _LAZY_MODULES:
+        value = importlib.import_module(name)
+    else:
+        module = _LAZY_IMPORTS.get(name)
+        if module is None:
+            raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+        value = getattr(importlib.import_module(f".{module}", __package__), name)
+    globals()[name] = value
+    return value
+
+
+# Availability flag for each hardware module
+_AVAILABLE_FLAGS = {
+    "lcd_1inch": "LCD_1INCH_AVAILABLE",
+    "lcd_5inch": "LCD_5INCH_AVAILABLE",
+    "led_controller": "LED_AVAILABLE",
+    "fan_controller": "FAN_AVAILABLE",
+}
+
+
+def _load(name: str):
+    """
+    Import a lazy name (see __getattr__), or None if its module fails to import.
+
+    A hardware module that fails to import is marked unavailable, so it is
+    reported as such and not retried.
+    """
+    try:
+        return __getattr__(name)
+    except ImportError as e:
+        logger.warning(f"Could not import {name}: {e}")
+        flag = _AVAILABLE_FLAGS.get(_LAZY_IMPORTS.get(name))
+        if flag:
+            globals()[flag] = False
+            _build_status_templates()
+        return None
 
-logger = logging.getLogger(__name__)
 
 # Create FastMCP server
 mcp = FastMCP("BrainBot Hardware MCP Server")
 
+
+# Tools return plain dicts: FastMCP serializes them once, as structured
+# content, instead of embedding an already-encoded JSON string
+
+def _ok(**fields) -> dict:
+    """Success response; fields that are None are left out."""
+    return {"success": True, **{k: v for k, v in fields.items() if v is not None}}
+
+
+def _err(error: str) -> dict:
+    """Failure response."""
+    return {"success": False, "error": error}
+
+
+# Shared response for tools with nothing to report (clear, off, ...);
+# like the per-device "not available" errors below it is built once and
+# must not be mutated by callers
+_OK = _ok()
+
+
+ResponseFormat = Literal["text", "structured", "both"]
+
+
+def _tool(fn: Callable[..., Union[dict, str]]):
+    """
+    Register fn as an MCP tool that takes a response_format argument.
+
+    "both" (the default) sends the JSON text block and structuredContent,
+    as the MCP spec recommends for compatibility; "structured" or "text"
+    sends only one of them, halving the response for clients that read
+    just one. Table strings are always sent as text. fn itself is left
+    untouched and keeps returning dicts for direct callers.
+    """
+    @functools.wraps(fn)
+    def wrapper(*args, response_format: ResponseFormat = "both", **kwargs) -> ToolResult:
+        result = fn(*args, **kwargs)
+        if isinstance(result, str) or response_format == "text":
+            return ToolResult(content=result)
+        if response_format == "structured":
+            return ToolResult(content=[], structured_content=result)
+        return ToolResult(content=result, structured_content=result)
+
+    signature = inspect.signature(fn)
+    wrapper.__signature__ = signature.replace(
+        parameters=[
+            *signature.parameters.values(),
+            inspect.Parameter(
+                "response_format", inspect.Parameter.KEYWORD_ONLY, default="both", annotation=ResponseFormat
+            ),
+        ],
+        return_annotation=ToolResult,
+    )
+    wrapper.__annotations__ = {**fn.__annotations__, "response_format": ResponseFormat, "return": ToolResult}
+    return mcp.tool(wrapper)
+
+
 # Hardware instances (initialized on demand)
 _lcd_1inch: Optional["LCD1Inch"] = None
 _lcd_5inch: Optional["LCD5Inch"] = None
 _led: Optional["LEDController"] = None
 _fan: Optional["FanController"] = None
 
+# Held while a device is created, so the startup warmup thread and a first
+# tool call don't both construct it
+_init_lock = threading.Lock()
+
 
 def _get_lcd_1inch():
     """Get or create 1-inch LCD instance."""
     global _lcd_1inch
     if _lcd_1inch is None and LCD_1INCH_AVAILABLE:
-        _lcd_1inch = LCD1Inch()
+        with _init_lock:
+            if _lcd_1inch is None:
+                factory = _load("create_lcd_1inch")
+                _lcd_1inch = factory() if factory else None
     return _lcd_1inch
 
 
@@ -56,7 +172,10 @@ def _get_lcd_5inch():
     """Get or create 5-inch LCD instance."""
     global _lcd_5inch
     if _lcd_5inch is None and LCD_5INCH_AVAILABLE:
-        _lcd_5inch = LCD5Inch()
+        with _init_lock:
+            if _lcd_5inch is None:
+                cls = _load("LCD5Inch")
+                _lcd_5inch = cls() if cls else None
     return _lcd_5inch
 
 
@@ -64,7 +183,10 @@ def _get_led():
     """Get or create LED controller instance."""
     global _led
     if _led is None and LED_AVAILABLE:
-        _led = LEDController()
+        with _init_lock:
+            if _led is None:
+                cls = _load("LEDController")
+                _led = cls() if cls else None
     return _led
 
 
@@ -72,112 +194,141 @@ def _get_fan():
     """Get or create fan controller instance."""
     global _fan
     if _fan is None and FAN_AVAILABLE:
-        _fan = FanController()
+        with _init_lock:
+            if _fan is None:
+                cls = _load("FanController")
+                _fan = cls() if cls else None
     return _fan
 
 
+def _hw_tool(getter: Callable[[], object], name: str):
+    """
+    Wrap a tool body that drives one hardware device.
+
+    The wrapper fetches the device, answers a prebuilt "<name> not
+    available" error when it is missing, and turns the body's fields or exception into the usual
+    success/failure response. The device parameter is hidden from the
+    tool's signature.
+
+    Args:
+        getter: Returns the device instance, or None when unavailable
+        name: Device name used in the not-available error
+    """
+    unavailable = _err(f"{name} not available")
+
+    def decorator(fn: Callable[..., dict]) -> Callable[..., dict]:
+        @functools.wraps(fn)
+        def wrapper(*args, **kwargs) -> dict:
+            device = getter()
+            if device is None:
+                return unavailable
+            try:
+                fields = fn(device, *args, **kwargs)
+                return _ok(**fields) if fields else _OK
+            except Exception as e:
+                return _err(str(e))
+
+        signature = inspect.signature(fn)
+        wrapper.__signature__ = signature.replace(parameters=list(signature.parameters.values())[1:])
+        return wrapper
+
+    return decorator
+
+
 # ============ LCD 1-inch Tools ============
 
-def _lcd_1inch_text(line1: str, line2: str = "") -> str:
+@_hw_tool(_get_lcd_1inch, "1-inch LCD")
+def _lcd_1inch_text(lcd, line1: str, line2: str = "") -> dict:
     """Display text on 1-inch B&W OLED display."""
-    lcd = _get_lcd_1inch()
-    if lcd is None:
-        return json.dumps({
-            "success": False,
-            "error": "1-inch LCD not available",
-        })
-
-    try:
-        lcd.display_text(line1, line2)
-        return json.dumps({
-            "success": True,
-            "displayed": {"line1": line1, "line2": line2},
-        })
-    except Exception as e:
-        return json.dumps({
-            "success": False,
-            "error": str(e),
-        })
+    lcd.display_text(line1, line2)
+    return {"displayed": {"line1": line1, "line2": line2}}
 
 
-lcd_1inch_text = mcp.tool()(_lcd_1inch_text)
+lcd_1inch_text = _tool(_lcd_1inch_text)
 
 
-def _lcd_1inch_clear() -> str:
+@_hw_tool(_get_lcd_1inch, "1-inch LCD")
+def _lcd_1inch_clear(lcd) -> dict:
     """Clear the 1-inch display."""
-    lcd = _get_lcd_1inch()
-    if lcd is None:
-        return json.dumps({"success": False, "error": "1-inch LCD not available"})
-
-    try:
-        lcd.clear()
-        return json.dumps({"success": True})
-    except Exception as e:
-        return json.dumps({"success": False, "error": str(e)})
+    lcd.clear()
+    return {}
 
 
-lcd_1inch_clear = mcp.tool()(_lcd_1inch_clear)
+lcd_1inch_clear = _tool(_lcd_1inch_clear)
 
 
 # ============ LCD 5-inch Tools ============
 
-def _lcd_5inch_status(title: str, status: str, progress: float = 0.0) -> str:
+@_hw_tool(_get_lcd_5inch, "5-inch LCD")
+def _lcd_5inch_status(lcd, title: str, status: str, progress: float = 0.0) -> dict:
     """Display status information on 5-inch main display."""
-    lcd = _get_lcd_5inch()
-    if lcd is None:
-        return json.dumps({"success": False, "error": "5-inch LCD not available"})
-
-    try:
-        lcd.display_status(title, status, progress)
-        return json.dumps({
-            "success": True,
-            "displayed": {"title": title, "status": status, "progress": progress},
-        })
-    except Exception as e:
-        return json.dumps({"success": False, "error": str(e)})
+    lcd.display_status(title, status, progress)
+    return {"displayed": {"title": title, "status": status, "progress": progress}}
 
 
-lcd_5inch_status = mcp.tool()(_lcd_5inch_status)
+lcd_5inch_status = _tool(_lcd_5inch_status)
 
 
-def _lcd_5inch_story(title: str, text: str) -> str:
+@_hw_tool(_get_lcd_5inch, "5-inch LCD")
+def _lcd_5inch_story(lcd, title: str, text: str) -> dict:
     """Display a bedtime story on 5-inch display."""
-    lcd = _get_lcd_5inch()
-    if lcd is None:
-        return json.dumps({"success": False, "error": "5-inch LCD not available"})
+    lcd.display_story(title, text)
+    return {"displayed": {"title": title, "text_length": len(text)}}
 
-    try:
-        lcd.display_story(title, text)
-        return json.dumps({
-            "success": True,
-            "displayed": {"title": title, "text_length": len(text)},
-        })
-    except Exception as e:
-        return json.dumps({"success": False, "error": str(e)})
 
+lcd_5inch_story = _tool(_lcd_5inch_story)
 
-lcd_5inch_story = mcp.tool()(_lcd_5inch_story)
 
-
-def _lcd_5inch_clear() -> str:
+@_hw_tool(_get_lcd_5inch, "5-inch LCD")
+def _lcd_5inch_clear(lcd) -> dict:
     """Clear the 5-inch display."""
-    lcd = _get_lcd_5inch()
-    if lcd is None:
-        return json.dumps({"success": False, "error": "5-inch LCD not available"})
-
-    try:
-        lcd.clear()
-        return json.dumps({"success": True})
-    except Exception as e:
-        return json.dumps({"success": False, "error": str(e)})
+    lcd.clear()
+    return {}
 
 
-lcd_5inch_clear = mcp.tool()(_lcd_5inch_clear)
+lcd_5inch_clear = _tool(_lcd_5inch_clear)
 
 
 # ============ LED Tools ============
 
-def _led_set_pattern(pattern: str, color: str = "white", speed: float = 1.0) -> str:
+# Mood to (pattern, color, speed) mapping
+_MOOD_PATTERNS: dict[str, tuple[str, str, float]] = {
+    "content": ("breathe", "green", 1.0),
+    "excited": ("pulse", "yellow", 2.0),
+    "focused": ("solid", "blue", 1.0),
+    "tired": ("breathe", "orange", 0.5),
+    "bored": ("chase", "purple", 0.8),
+    "curious": ("rainbow", "rainbow", 1.5),
+    "sleeping": ("breathe", "dim_blue", 0.3),
+    "accomplished": ("pulse", "gold", 1.5),
+}
+_MOOD_DEFAULT = ("solid", "white", 1.0)
+
+# (controller, {mood: (bound set_pattern call, (pattern, color, speed))}),
+# rebuilt only when the LED controller instance changes
+_mood_dispatch: tuple = (None, {})
+
+# (controller, pattern, color, speed) last applied through these tools;
+# repeating it leaves the running animation alone instead of restarting it
+_last_pattern: Optional[tuple] = None
+
+
+def _mood_calls(led) -> dict:
+    """Per-mood set_pattern calls bound to led, with the default under None."""
+    global _mood_dispatch
+    owner, calls = _mood_dispatch
+    if owner is not led:
+        calls = {
+            mood: (functools.partial(led.set_pattern, *info), info)
+            for mood, info in _MOOD_PATTERNS.items()
+        }
+        calls[None] = (functools.partial(led.set_pattern, *_MOOD_DEFAULT), _MOOD_DEFAULT)
+        _mood_dispatch = (led, calls)
+    return calls
+
+
+@_hw_tool(_get_led, "LED controller")
+def _led_set_pattern(led, pattern: str, color: str = "white", speed: float = 1.0) -> dict:
     """
     Set LED pattern and color.
 
@@ -186,211 +337,356 @@ def _led_set_pattern(pattern: str, color: str = "white", speed: float = 1.0) ->
         color: Color name or hex code
         speed: Animation speed (0.1 to 5.0)
     """
-    led = _get_led()
-    if led is None:
-        return json.dumps({"success": False, "error": "LED controller not available"})
-
-    try:
+    global _last_pattern
+    state = (led, pattern, color, speed)
+    if state != _last_pattern:
         led.set_pattern(pattern, color, speed)
-        return json.dumps({
-            "success": True,
-            "pattern": pattern,
-            "color": color,
-            "speed": speed,
-        })
-    except Exception as e:
-        return json.dumps({"success": False, "error": str(e)})
+        _last_pattern = state
+    return {"pattern": pattern, "color": color, "speed": speed}
 
 
-led_set_pattern = mcp.tool()(_led_set_pattern)
+led_set_pattern = _tool(_led_set_pattern)
 
 
-def _led_mood(mood: str) -> str:
+@_hw_tool(_get_led, "LED controller")
+def _led_mood(led, mood: str) -> dict:
     """
     Set LED to match BrainBot's mood.
 
     Args:
         mood: Mood name (content, excited, focused, tired, bored, curious, sleeping)
     """
-    led = _get_led()
-    if led is None:
-        return json.dumps({"success": False, "error": "LED controller not available"})
-
-    # Mood to pattern/color mapping
-    mood_patterns = {
-        "content": ("breathe", "green", 1.0),
-        "excited": ("pulse", "yellow", 2.0),
-        "focused": ("solid", "blue", 1.0),
-        "tired": ("breathe", "orange", 0.5),
-        "bored": ("chase", "purple", 0.8),
-        "curious": ("rainbow", "rainbow", 1.5),
-        "sleeping": ("breathe", "dim_blue", 0.3),
-        "accomplished": ("pulse", "gold", 1.5),
-    }
-
-    pattern_info = mood_patterns.get(mood.lower(), ("solid", "white", 1.0))
-
-    try:
-        led.set_pattern(*pattern_info)
-        return json.dumps({
-            "success": True,
-            "mood": mood,
-            "pattern": pattern_info[0],
-            "color": pattern_info[1],
-        })
-    except Exception as e:
-        return json.dumps({"success": False, "error": str(e)})
+    global _last_pattern
+    calls = _mood_calls(led)
+    # Exact names (the usual case) skip the lower() copy
+    set_mood, info = calls.get(mood) or calls.get(mood.lower()) or calls[None]
+    state = (led, *info)
+    if state != _last_pattern:
+        set_mood()
+        _last_pattern = state
+    return {"mood": mood, "pattern": info[0], "color": info[1]}
 
 
-led_mood = mcp.tool()(_led_mood)
+led_mood = _tool(_led_mood)
 
 
-def _led_off() -> str:
+@_hw_tool(_get_led, "LED controller")
+def _led_off(led) -> dict:
     """Turn off all LEDs."""
-    led = _get_led()
-    if led is None:
-        return json.dumps({"success": False, "error": "LED controller not available"})
-
-    try:
-        led.off()
-        return json.dumps({"success": True})
-    except Exception as e:
-        return json.dumps({"success": False, "error": str(e)})
+    global _last_pattern
+    led.off()
+    _last_pattern = None
+    return {}
 
 
-led_off = mcp.tool()(_led_off)
+led_off = _tool(_led_off)
 
 
 # ============ Fan Tools ============
 
-def _fan_set_speed(percent: int) -> str:
+@_hw_tool(_get_fan, "Fan controller")
+def _fan_set_speed(fan, percent: int) -> dict:
     """
     Set fan speed.
 
     Args:
         percent: Fan speed 0-100
     """
-    fan = _get_fan()
-    if fan is None:
-        return json.dumps({"success": False, "error": "Fan controller not available"})
-
-    try:
+    # Skip the PWM write when the duty cycle wouldn't change
+    if max(0, min(100, percent)) != fan.get_speed():
         fan.set_speed(percent)
-        return json.dumps({
-            "success": True,
-            "speed_percent": percent,
-        })
-    except Exception as e:
-        return json.dumps({"success": False, "error": str(e)})
+    return {"speed_percent": percent}
 
 
-fan_set_speed = mcp.tool()(_fan_set_speed)
+fan_set_speed = _tool(_fan_set_speed)
 
 
-def _fan_auto() -> str:
+@_hw_tool(_get_fan, "Fan controller")
+def _fan_auto(fan) -> dict:
     """Enable automatic fan control based on temperature."""
-    fan = _get_fan()
-    if fan is None:
-        return json.dumps({"success": False, "error": "Fan controller not available"})
-
-    try:
-        fan.enable_auto()
-        return json.dumps({
-            "success": True,
-            "mode": "auto",
-        })
-    except Exception as e:
-        return json.dumps({"success": False, "error": str(e)})
+    fan.enable_auto()
+    return {"mode": "auto"}
 
 
-fan_auto = mcp.tool()(_fan_auto)
+fan_auto = _tool(_fan_auto)
 
 
 # ============ System Tools ============
 
-def _get_system_health() -> str:
+THERMAL_FILE = "/sys/class/thermal/thermal_zone0/temp"
+
+# Kept open across calls (sysfs re-reads after seek(0)); the open is tried
+# once, so hosts without the file don't pay for a failing open each poll
+_thermal_file: Optional[IO[bytes]] = None
+_thermal_checked = False
+_thermal_lock = threading.Lock()
+
+
+def _read_cpu_temperature() -> Optional[float]:
+    """CPU temperature in Celsius, or None if unavailable."""
+    global _thermal_file, _thermal_checked
+    with _thermal_lock:
+        if not _thermal_checked:
+            _thermal_checked = True
+            try:
+                _thermal_file = open(THERMAL_FILE, "rb")
+            except OSError:
+                logger.debug(f"CPU temperature not available ({THERMAL_FILE})")
+        if _thermal_file is None:
+            return None
+        try:
+            _thermal_file.seek(0)
+            return round(int(_thermal_file.read().strip()) / 1000.0, 1)
+        except Exception:
+            return None
+
+
+# CPU usage is sampled once a second by a background thread, started on the
+# first health request, so requests read the latest value instead of
+# blocking for a measurement interval
+CPU_SAMPLE_INTERVAL = 1.0
+
+_cpu_percent_value: Optional[float] = None
+_cpu_sampler: Optional[threading.Thread] = None
+_cpu_sampler_lock = threading.Lock()
+
+
+def _cpu_sample_loop(psutil) -> None:
+    """Refresh _cpu_percent_value forever (daemon thread)."""
+    global _cpu_percent_value
+    while True:
+        time.sleep(CPU_SAMPLE_INTERVAL)
+        try:
+            _cpu_percent_value = psutil.cpu_percent(interval=None)
+        except Exception as e:
+            # Keep sampling; a dead thread would freeze the reported value
+            logger.warning(f"CPU usage sample failed: {e}")
+
+
+def _cpu_percent(psutil) -> float:
+    """Latest sampled CPU usage; 0.0 until the first sample is in."""
+    global _cpu_sampler
+    if _cpu_sampler is None:
+        with _cpu_sampler_lock:
+            if _cpu_sampler is None:
+                # Prime psutil's baseline for the non-blocking deltas
+                psutil.cpu_percent(interval=None)
+                _cpu_sampler = threading.Thread(
+                    target=_cpu_sample_loop, args=(psutil,), name="cpu-sampler", daemon=True
+                )
+                _cpu_sampler.start()
+    if _cpu_percent_value is None:
+        return 0.0
+    return _cpu_percent_value
+
+
+# Memory and root-disk usage change slowly, so polling clients share a
+# recent reading instead of re-querying on every request
+_MEMORY_TTL_SECONDS = 1.0
+_DISK_TTL_SECONDS = 5.0
+
+_memory_cache: tuple = (0.0, None)  # (monotonic time, reading)
+_disk_cache: tuple = (0.0, None)
+
+
+MEMINFO_FILE = "/proc/meminfo"
+
+# Like the thermal file: opened once and re-read, since only MemTotal and
+# MemAvailable (the first lines) are needed, not psutil's full breakdown
+_meminfo_file: Optional[IO[bytes]] = None
+_meminfo_checked = False
+_meminfo_lock = threading.Lock()
+
+
+def _read_meminfo() -> Optional[Tuple[int, int]]:
+    """(total, available) memory in bytes from /proc/meminfo, or None."""
+    global _meminfo_file, _meminfo_checked
+    with _meminfo_lock:
+        if not _meminfo_checked:
+            _meminfo_checked = True
+            try:
+                _meminfo_file = open(MEMINFO_FILE, "rb")
+            except OSError:
+                logger.debug(f"{MEMINFO_FILE} not available, using psutil")
+        if _meminfo_file is None:
+            return None
+        try:
+            _meminfo_file.seek(0)
+            data = _meminfo_file.read(512)
+        except OSError:
+            return None
+
+    total = available = None
+    for line in data.split(b"\n"):
+        if line.startswith(b"MemTotal:"):
+            total = int(line.split()[1]) * 1024
+        elif line.startswith(b"MemAvailable:"):
+            available = int(line.split()[1]) * 1024
+            break
+    if total is None or available is None:
+        return None
+    return total, available
+
+
+def _memory_usage(psutil) -> Tuple[int, int]:
+    """(total, available) memory in bytes, at most _MEMORY_TTL_SECONDS old."""
+    global _memory_cache
+    now = time.monotonic()
+    cached_time, memory = _memory_cache
+    if memory is None or now - cached_time > _MEMORY_TTL_SECONDS:
+        memory = _read_meminfo()
+        if memory is None:
+            vm = psutil.virtual_memory()
+            memory = (vm.total, vm.available)
+        _memory_cache = (now, memory)
+    return memory
+
+
+def _disk_usage(psutil):
+    """psutil.disk_usage("/"), at most _DISK_TTL_SECONDS old."""
+    global _disk_cache
+    now = time.monotonic()
+    cached_time, disk = _disk_cache
+    if disk is None or now - cached_time > _DISK_TTL_SECONDS:
+        disk = psutil.disk_usage("/")
+        _disk_cache = (now, disk)
+    return disk
+
+
+def _get_system_health() -> dict:
     """Get system health information (CPU temp, memory, etc)."""
-    import psutil
-    import os
+    psutil = _load("psutil")
+    if psutil is None:
+        return _err("psutil not available")
 
     try:
         # CPU usage
-        cpu_percent = psutil.cpu_percent(interval=0.5)
+        cpu_percent = _cpu_percent(psutil)
 
         # Memory
-        memory = psutil.virtual_memory()
+        memory_total, memory_available = _memory_usage(psutil)
 
         # Disk
-        disk = psutil.disk_usage("/")
+        disk = _disk_usage(psutil)
 
         # Temperature
-        temp = None
-        thermal_file = "/sys/class/thermal/thermal_zone0/temp"
-        if os.path.exists(thermal_file):
-            try:
-                with open(thermal_file) as f:
-                    temp = int(f.read().strip()) / 1000.0
-            except Exception:
-                pass
-
-        return json.dumps({
-            "success": True,
-            "cpu_percent": cpu_percent,
-            "memory": {
-                "percent": memory.percent,
-                "available_mb": memory.available / (1024 * 1024),
-                "total_mb": memory.total / (1024 * 1024),
+        temp = _read_cpu_temperature()
+
+        return _ok(
+            cpu_percent=cpu_percent,
+            memory={
+                # Same definition and rounding as psutil's percent
+                "percent": round((memory_total - memory_available) / memory_total * 100, 1),
+                "available_mb": memory_available >> 20,
+                "total_mb": memory_total >> 20,
             },
-            "disk": {
+            disk={
                 "percent": disk.percent,
-                "free_gb": disk.free / (1024 * 1024 * 1024),
-                "total_gb": disk.total / (1024 * 1024 * 1024),
+                "free_gb": round(disk.free / (1024 * 1024 * 1024), 1),
+                "total_gb": round(disk.total / (1024 * 1024 * 1024), 1),
             },
-            "temperature_celsius": temp,
-        }, indent=2)
+            temperature_celsius=temp,
+        )
     except Exception as e:
-        return json.dumps({"success": False, "error": str(e)})
-
-
-get_system_health = mcp.tool()(_get_system_health)
-
-
-def _get_hardware_status() -> str:
-    """Get status of all hardware components."""
-    status = {
-        "lcd_1inch": {
-            "available": LCD_1INCH_AVAILABLE,
-            "initialized": _lcd_1inch is not None,
-        },
-        "lcd_5inch": {
-            "available": LCD_5INCH_AVAILABLE,
-            "initialized": _lcd_5inch is not None,
-        },
-        "led": {
-            "available": LED_AVAILABLE,
-            "initialized": _led is not None,
-        },
-        "fan": {
-            "available": FAN_AVAILABLE,
-            "initialized": _fan is not None,
-        },
+        return _err(str(e))
+
+
+get_system_health = _tool(_get_system_health)
+
+
+# Availability only changes when _load marks a controller unavailable, so
+# each table format is prebuilt with just the initialized column left to
+# fill in per call, and rebuilt by _load when a flag is cleared
+_STATUS_AVAILABLE: tuple = ()
+_STATUS_TEMPLATES: dict = {}
+
+
+def _build_status_templates() -> None:
+    """(Re)build the hardware status tables from the current availability flags."""
+    global _STATUS_AVAILABLE, _STATUS_TEMPLATES
+    _STATUS_AVAILABLE = (
+        ("lcd_1inch", LCD_1INCH_AVAILABLE),
+        ("lcd_5inch", LCD_5INCH_AVAILABLE),
+        ("led", LED_AVAILABLE),
+        ("fan", FAN_AVAILABLE),
+    )
+    _STATUS_TEMPLATES = {
+        "tsv": "\n".join(
+            ["component\tavailable\tinitialized"]
+            + [f"{name}\t{available}\t{{}}" for name, available in _STATUS_AVAILABLE]
+        ),
+        "markdown": "\n".join(
+            ["| component | available | initialized |", "|---|---|---|"]
+            + [f"| {name} | {available} | {{}} |" for name, available in _STATUS_AVAILABLE]
+        ),
     }
-    return json.dumps(status, indent=2)
 
 
-get_hardware_status = mcp.tool()(_get_hardware_status)
+_build_status_templates()
+
+
+def _get_hardware_status(format: Literal["json", "markdown", "tsv"] = "markdown") -> Union[dict, str]:
+    """
+    Get status of all hardware components.
+
+    Args:
+        format: "markdown" table (default), "tsv", or "json"
+    """
+    initialized = (
+        _lcd_1inch is not None,
+        _lcd_5inch is not None,
+        _led is not None,
+        _fan is not None,
+    )
+
+    if format == "json":
+        return {
+            name: {"available": available, "initialized": init}
+            for (name, available), init in zip(_STATUS_AVAILABLE, initialized)
+        }
+
+    template = _STATUS_TEMPLATES["tsv" if format == "tsv" else "markdown"]
+    return template.format(*initialized)
+
+
+get_hardware_status = _tool(_get_hardware_status)
+
+
+def _import_controllers() -> None:
+    """Import each available controller, so failed imports clear its flag."""
+    for name in ("create_lcd_1inch", "LCD5Inch", "LEDController", "FanController"):
+        if globals()[_AVAILABLE_FLAGS[_LAZY_IMPORTS[name]]]:
+            _load(name)
+
+
+def _warmup() -> None:
+    """Create each available device ahead of its first tool call."""
+    for getter in (_get_lcd_1inch, _get_lcd_5inch, _get_led, _get_fan):
+        try:
+            getter()
+        except Exception as e:
+            logger.warning(f"Hardware warmup: {getter.__name__} failed: {e}")
 
 
 # Entry point
 def main():
     """Run the MCP server."""
-    # Log startup to stderr (stdout is for MCP protocol)
-    print("Starting BrainBot Hardware MCP Server...", file=sys.stderr)
-    print(f"Hardware availability:", file=sys.stderr)
-    print(f"  LCD 1-inch: {LCD_1INCH_AVAILABLE}", file=sys.stderr)
-    print(f"  LCD 5-inch: {LCD_5INCH_AVAILABLE}", file=sys.stderr)
-    print(f"  LED: {LED_AVAILABLE}", file=sys.stderr)
-    print(f"  Fan: {FAN_AVAILABLE}", file=sys.stderr)
+    # The banner reports what actually imports, not just what was found
+    _import_controllers()
+
+    # Log startup to stderr (stdout is for MCP protocol), in one write
+    sys.stderr.write(
+        "Starting BrainBot Hardware MCP Server...\n"
+        "Hardware availability:\n"
+        f"  LCD 1-inch: {LCD_1INCH_AVAILABLE}\n"
+        f"  LCD 5-inch: {LCD_5INCH_AVAILABLE}\n"
+        f"  LED: {LED_AVAILABLE}\n"
+        f"  Fan: {FAN_AVAILABLE}\n"
+    )
+
+    # Bring the devices up in the background, so the first tool call
+    # doesn't wait for SPI/I2C/PWM setup
+    threading.Thread(target=_warmup, name="hardware-warmup", daemon=True).start()
 
     mcp.run()
 
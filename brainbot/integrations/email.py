@@ -15,15 +15,18 @@ import email
 import imaplib
 import json
 import logging
+import queue
 import re
 import smtplib
 import ssl
+import threading
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 from email.header import decode_header
 from email.mime.multipart import MIMEMultipart
 from email.mime.text import MIMEText
 from pathlib import Path
-from typing import Optional, TYPE_CHECKING
+from typing import Optional, Tuple, TYPE_CHECKING
 
 from pydantic import BaseModel, Field
 
@@ -209,6 +212,145 @@ class DailyDigest(BaseModel):
         return "\n".join(lines)
 
 
+class SMTPConnectionPool:
+    """
+    Pool of logged-in SMTP_SSL sessions shared by concurrent sends.
+
+    Idle sessions are checked with NOOP before reuse, since the server
+    closes idle connections, and are retired after max_msgs messages to
+    stay within per-connection sending limits. At most max_size sessions
+    are open at once; further acquirers wait for one to be released.
+    """
+
+    def __init__(
+        self,
+        host: str,
+        port: int,
+        user: str,
+        password: str,
+        max_size: int = 5,
+        max_msgs: int = 100,
+    ):
+        """
+        Initialize the pool. No connection is made until the first send.
+
+        Args:
+            host: SMTP server host
+            port: SMTP server port (implicit TLS)
+            user: SMTP login
+            password: SMTP password
+            max_size: Maximum number of open sessions
+            max_msgs: Messages sent on a session before it is replaced
+        """
+        self.host = host
+        self.port = port
+        self.user = user
+        self.password = password
+        self.max_size = max_size
+        self.max_msgs = max_msgs
+
+        # Most recently released first, so a quiet pool keeps reusing
+        # one warm session instead of letting all of them go stale
+        self._idle: "queue.LifoQueue[Tuple[smtplib.SMTP_SSL, int]]" = queue.LifoQueue()
+        self._slots = threading.BoundedSemaphore(max_size)
+
+    def _connect(self) -> smtplib.SMTP_SSL:
+        """Open and log in a new session."""
+        context = ssl.create_default_context()
+        server = smtplib.SMTP_SSL(self.host, self.port, context=context)
+        try:
+            server.login(self.user, self.password)
+        except Exception:
+            server.close()
+            raise
+        return server
+
+    @staticmethod
+    def _discard(server: smtplib.SMTP_SSL, quit: bool = False) -> None:
+        """Close a session, politely (QUIT) if it is known to be healthy."""
+        try:
+            if quit:
+                server.quit()
+            else:
+                server.close()
+        except Exception:
+            pass
+
+    def acquire(self) -> Tuple[smtplib.SMTP_SSL, int]:
+        """
+        Take a live session from the pool, connecting a new one if none is idle.
+
+        Returns:
+            (session, messages already sent on it); pass both back to release()
+        """
+        self._slots.acquire()
+        try:
+            while True:
+                try:
+                    server, count = self._idle.get_nowait()
+                except queue.Empty:
+                    return self._connect(), 0
+                try:
+                    if server.noop()[0] == 250:
+                        return server, count
+                except (smtplib.SMTPException, OSError):
+                    pass
+                self._discard(server)
+        except Exception:
+            self._slots.release()
+            raise
+
+    def release(self, server: smtplib.SMTP_SSL, count: int, reusable: bool = True) -> None:
+        """
+        Return a session taken with acquire().
+
+        Args:
+            server: The session
+            count: Messages sent on it so far, including this use
+            reusable: False if the session may be in an unknown state
+        """
+        try:
+            if not reusable:
+                self._discard(server)
+            elif count >= self.max_msgs:
+                self._discard(server, quit=True)
+            else:
+                self._idle.put((server, count))
+        finally:
+            self._slots.release()
+
+    def send_message(self, msg) -> None:
+        """
+        Send msg on a pooled session.
+
+        A session the server dropped between the NOOP check and the send
+        is replaced and the send retried once.
+        """
+        for attempt in range(2):
+            server, count = self.acquire()
+            try:
+                server.send_message(msg)
+            except smtplib.SMTPServerDisconnected:
+                self.release(server, count, reusable=False)
+                if attempt:
+                    raise
+                continue
+            except Exception:
+                self.release(server, count, reusable=False)
+                raise
+            self.release(server, count + 1)
+            return
+
+    def close(self) -> None:
+        """Log out of and close all idle sessions."""
+        while True:
+            try:
+                server, _ = self._idle.get_nowait()
+            except queue.Empty:
+                return
+            self._discard(server, quit=True)
+
+
 class EmailIntegration:
     """
     Email integration using direct SMTP to Fastmail.
@@ -234,6 +376,15 @@ class EmailIntegration:
         self.memory_store = memory_store
         self.state_manager = state_manager
 
+        # Logged-in SMTP sessions kept open across sends, so each email
+        # after the first skips the TCP/TLS handshake and AUTH
+        self.smtp_pool = SMTPConnectionPool(
+            config.smtp_host,
+            config.smtp_port,
+            config.smtp_user,
+            config.smtp_password,
+        )
+
     def generate_digest(self, for_date: Optional[datetime] = None) -> DailyDigest:
         """
         Generate daily digest content.
@@ -400,16 +551,7 @@ class EmailIntegration:
         msg.attach(part2)
 
         try:
-            # Connect with SSL
-            context = ssl.create_default_context()
-
-            with smtplib.SMTP_SSL(
-                self.config.smtp_host,
-                self.config.smtp_port,
-                context=context,
-            ) as server:
-                server.login(self.config.smtp_user, self.config.smtp_password)
-                server.send_message(msg)
+            self.smtp_pool.send_message(msg)
 
             logger.info(f"Email sent to {to_email}: {subject}")
             return {"success": True, "to": to_email, "subject": subject}
@@ -426,6 +568,36 @@ class EmailIntegration:
             logger.error(f"Email error: {e}")
             return {"success": False, "error": str(e)}
 
+    def send_emails(self, emails: list[dict]) -> list[dict]:
+        """
+        Send several emails concurrently over the SMTP pool.
+
+        Args:
+            emails: Keyword arguments for send_email, one dict per email
+
+        Returns:
+            send_email results, in the same order as emails
+        """
+        if len(emails) <= 1:
+            return [self.send_email(**kwargs) for kwargs in emails]
+
+        with ThreadPoolExecutor(
+            max_workers=min(len(emails), self.smtp_pool.max_size),
+            thread_name_prefix="brainbot-email-send",
+        ) as executor:
+            return list(executor.map(lambda kwargs: self.send_email(**kwargs), emails))
+
+    def close(self) -> None:
+        """Log out of and close the pooled SMTP sessions."""
+        self.smtp_pool.close()
+
+    def __del__(self):
+        """Destructor to ensure cleanup."""
+        try:
+            self.close()
+        except Exception:
+            pass
+
     def send_digest(self, digest: Optional[DailyDigest] = None) -> dict:
         """
         Send daily digest email.
@@ -780,6 +952,7 @@ class EmailDaemon:
         if self._check_thread:
             self._check_thread.join(timeout=5)
 
+        self.email.close()
         logger.info("Email daemon stopped")
 
     def _imap_check_loop(self) -> None:
@@ -1,6 +1,5 @@
 """Local task execution with built-in handlers."""
 
-import json
 import logging
 from pathlib import Path
 from typing import Callable, Optional
@@ -237,8 +236,7 @@ class TaskExecutor:
             line1 = task.payload.get("line1", "")
             line2 = task.payload.get("line2", "")
 
-            result = _lcd_1inch_text(line1, line2)
-            result_data = json.loads(result)
+            result_data = _lcd_1inch_text(line1, line2)
 
             return {
                 "success": result_data.get("success", False),
@@ -258,8 +256,7 @@ class TaskExecutor:
             title = task.payload.get("title", "Story")
             text = task.payload.get("text", "")
 
-            result = _lcd_5inch_story(title, text)
-            result_data = json.loads(result)
+            result_data = _lcd_5inch_story(title, text)
 
             return {
                 "success": result_data.get("success", False),
@@ -280,8 +277,7 @@ class TaskExecutor:
             status = task.payload.get("status", "")
             progress = task.payload.get("progress", 0.0)
 
-            result = _lcd_5inch_status(title, status, progress)
-            result_data = json.loads(result)
+            result_data = _lcd_5inch_status(title, status, progress)
 
             return {
                 "success": result_data.get("success", False),
@@ -300,8 +296,7 @@ class TaskExecutor:
 
             mood = task.payload.get("mood", "content")
 
-            result = _led_mood(mood)
-            result_data = json.loads(result)
+            result_data = _led_mood(mood)
 
             return {
                 "success": result_data.get("success", False),
@@ -322,8 +317,7 @@ class TaskExecutor:
             color = task.payload.get("color", "white")
             speed = task.payload.get("speed", 1.0)
 
-            result = _led_set_pattern(pattern, color, speed)
-            result_data = json.loads(result)
+            result_data = _led_set_pattern(pattern, color, speed)
 
             return {
                 "success": result_data.get("success", False),
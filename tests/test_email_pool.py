@@ -0,0 +1,151 @@
+"""Tests for the BrainBot SMTP connection pool.
+
+Tests cover:
+- Session reuse and the NOOP liveness check
+- Retry once when the server drops a session
+- Retirement with QUIT after max_msgs messages
+- Closing idle sessions
+- Bounding open sessions to max_size
+"""
+
+import smtplib
+import threading
+from unittest import mock
+
+import pytest
+
+from brainbot.integrations.email import SMTPConnectionPool
+
+
+class FakeSMTP:
+    """Stand-in for smtplib.SMTP_SSL that records what it is asked to do."""
+
+    instances: list = []
+
+    def __init__(self, host, port, context=None):
+        self.host = host
+        self.port = port
+        self.alive = True
+        self.drop_on_send = False
+        self.logged_in = False
+        self.sent = []
+        self.quit_called = False
+        self.closed = False
+        FakeSMTP.instances.append(self)
+
+    def login(self, user, password):
+        self.logged_in = True
+
+    def noop(self):
+        if not self.alive:
+            raise smtplib.SMTPServerDisconnected("connection closed")
+        return (250, b"OK")
+
+    def send_message(self, msg):
+        if self.drop_on_send:
+            self.alive = False
+            raise smtplib.SMTPServerDisconnected("connection closed")
+        self.sent.append(msg)
+
+    def quit(self):
+        self.quit_called = True
+        self.closed = True
+
+    def close(self):
+        self.closed = True
+
+
+@pytest.fixture
+def pool():
+    """Pool whose sessions are FakeSMTP instances."""
+    FakeSMTP.instances = []
+    with mock.patch("brainbot.integrations.email.smtplib.SMTP_SSL", FakeSMTP):
+        yield SMTPConnectionPool("smtp.example.com", 465, "user", "pw", max_size=2, max_msgs=3)
+
+
+class TestSMTPConnectionPool:
+    """Tests for SMTPConnectionPool."""
+
+    def test_reuses_session(self, pool):
+        """Test consecutive sends share one logged-in session."""
+        pool.send_message("a")
+        pool.send_message("b")
+
+        assert len(FakeSMTP.instances) == 1
+        server = FakeSMTP.instances[0]
+        assert server.logged_in
+        assert server.sent == ["a", "b"]
+
+    def test_dead_idle_session_replaced(self, pool):
+        """Test an idle session failing NOOP is discarded, not used."""
+        pool.send_message("a")
+        FakeSMTP.instances[0].alive = False
+
+        pool.send_message("b")
+
+        first, second = FakeSMTP.instances
+        assert first.closed
+        assert second.sent == ["b"]
+
+    def test_retry_once_on_disconnect(self, pool):
+        """Test a session dropped mid-send is replaced and the send retried."""
+        pool.send_message("a")
+        FakeSMTP.instances[0].drop_on_send = True
+
+        pool.send_message("b")
+
+        first, second = FakeSMTP.instances
+        assert first.closed
+        assert first.sent == ["a"]
+        assert second.sent == ["b"]
+
+    def test_gives_up_after_second_disconnect(self, pool):
+        """Test a second disconnect in a row is raised to the caller."""
+        with mock.patch.object(FakeSMTP, "send_message", side_effect=smtplib.SMTPServerDisconnected("gone")):
+            with pytest.raises(smtplib.SMTPServerDisconnected):
+                pool.send_message("a")
+
+        assert len(FakeSMTP.instances) == 2
+        assert all(server.closed for server in FakeSMTP.instances)
+
+    def test_retired_after_max_msgs(self, pool):
+        """Test a session is closed with QUIT after max_msgs messages."""
+        for i in range(4):
+            pool.send_message(i)
+
+        first, second = FakeSMTP.instances
+        assert first.sent == [0, 1, 2]
+        assert first.quit_called
+        assert second.sent == [3]
+        assert not second.quit_called
+
+    def test_close_quits_idle_sessions(self, pool):
+        """Test close() logs out of every idle session."""
+        held, count = pool.acquire()
+        pool.send_message("a")
+        pool.release(held, count)
+
+        pool.close()
+
+        assert len(FakeSMTP.instances) == 2
+        assert all(server.quit_called for server in FakeSMTP.instances)
+
+    def test_acquire_bounded_by_max_size(self, pool):
+        """Test acquire() waits for a release once max_size sessions are out."""
+        taken = [pool.acquire(), pool.acquire()]
+        acquired = threading.Event()
+
+        def third():
+            pool.release(*pool.acquire())
+            acquired.set()
+
+        thread = threading.Thread(target=third, daemon=True)
+        thread.start()
+        assert not acquired.wait(0.2)
+
+        pool.release(*taken.pop())
+        assert acquired.wait(2)
+        thread.join(timeout=2)
+        pool.release(*taken.pop())
+
+        assert len(FakeSMTP.instances) == 2